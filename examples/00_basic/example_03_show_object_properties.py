@@ -27,6 +27,7 @@ Display properties for an object
 
 Using supplied files, this example shows how to display the properties
 that you would see in an object's details view in the Mechanical GUI.
+It then collects the properties of a whole subtree in a single call.
 
 """
 
@@ -35,6 +36,7 @@ that you would see in an object's details view in the Mechanical GUI.
 # ~~~~~~~~~~~~~~~~~~~~~~~
 # Download the required files. Print the file path for the MECHDAT file.
 
+import json
 import os
 
 from ansys.mechanical.core import launch_mechanical
@@ -98,6 +100,51 @@ json.dumps(props, indent=1)
 """)
 print(f"AnalysisSettings properties:\n{result}")
 
+# %%
+# Collect the properties of a whole subtree
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Collect the properties of every object under all analyses, the connections,
+# and the mesh in one call. The result is returned as a columnar table: one list each
+# for the object ID, the tree path, the property caption, and the value.
+
+result = mechanical.run_python_script("""
+import json
+
+def walk(obj, path):
+    yield obj, path
+    for child in obj.Children:
+        for item in walk(child, path + "/" + child.Name):
+            yield item
+
+table = {"object_id": [], "path": [], "caption": [], "value": []}
+for root in list(Model.Analyses) + [Model.Connections, Model.Mesh]:
+    for obj, path in walk(root, root.Name):
+        if not hasattr(obj, "VisibleProperties"):
+            continue
+        for prop in obj.VisibleProperties:
+            table["object_id"].append(obj.ObjectId)
+            table["path"].append(path)
+            table["caption"].append(prop.Caption)
+            table["value"].append(prop.StringValue)
+
+json.dumps(table)
+""")
+table = json.loads(result)
+
+
+def to_typed_value(value):
+    """Convert a property string to a number when possible."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+table["value"] = [to_typed_value(value) for value in table["value"]]
+print(f"Collected {len(table['caption'])} properties of {len(set(table['object_id']))} objects")
+for path, caption, value in list(zip(table["path"], table["caption"], table["value"]))[:20]:
+    print(f"{path:<50} {caption:<30} {value!r}")
+
 # %%
 # Clear the data
 # ~~~~~~~~~~~~~~
@@ -0,0 +1,332 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_01_measure_round_trip_cost:
+
+Measure the cost of remote calls
+--------------------------------
+
+This example measures the client-side cost of the calls that the other
+examples use: ``run_python_script``, ``upload``, ``download``, and ``list_files``.
+The measurements run against a stand-in server that implements the Mechanical
+gRPC service with a configurable latency and bandwidth, so transport and
+orchestration changes can be benchmarked on any machine without a licensed
+Mechanical. When a Mechanical session is available, the same measurements run
+against it for comparison.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+import tempfile
+import time
+
+from ansys.api.mechanical.v0 import mechanical_pb2, mechanical_pb2_grpc
+from ansys.mechanical.core import Mechanical, launch_mechanical
+import grpc
+from matplotlib import pyplot as plt
+import numpy as np
+
+# %%
+# Define the stand-in server
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The stand-in server implements the RPCs of the Mechanical gRPC service that
+# the client uses. Every call waits for ``latency`` seconds, and every script
+# and file chunk waits for its size divided by ``bandwidth``. Scripts are not
+# run. A script returns the first canned response whose key it contains, and
+# an empty string otherwise. The ``list_files`` script lists the directory that
+# stands in for the project directory, and uploads and downloads use real files
+# in that directory.
+
+
+class StandInMechanical(mechanical_pb2_grpc.MechanicalServiceServicer):
+    """Stand-in Mechanical gRPC service with configurable latency and bandwidth."""
+
+    def __init__(self, project_directory, latency=0.001, bandwidth=100 * 1024**2, responses=None):
+        self.project_directory = project_directory
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.responses = {"ProjectDirectory": project_directory, "VersionString": "252"}
+        self.responses.update(responses or {})
+        self.calls = 0
+
+    def _transfer(self, n_bytes):
+        time.sleep(n_bytes / self.bandwidth)
+
+    def _script_result(self, script):
+        if "os.walk(rootDir)" in script:
+            return "\n".join(
+                os.path.join(directory, file_name)
+                for directory, _, file_names in os.walk(self.project_directory)
+                for file_name in file_names
+            )
+        for key, response in self.responses.items():
+            if key in script:
+                return response
+        return ""
+
+    def RunPythonScript(self, request, context):
+        self.calls += 1
+        time.sleep(self.latency)
+        self._transfer(len(request.script_code))
+        yield mechanical_pb2.RunScriptResponse(
+            script_result=self._script_result(request.script_code), log_info="__done__"
+        )
+
+    def UploadFile(self, request_iterator, context):
+        self.calls += 1
+        time.sleep(self.latency)
+        file = None
+        for request in request_iterator:
+            if file is None:
+                file = open(os.path.join(request.file_location, request.file_name), "wb")
+            self._transfer(request.chunk.size)
+            file.write(request.chunk.payload)
+        if file is None:
+            return mechanical_pb2.FileUploadResponse(is_ok=False)
+        file.close()
+        return mechanical_pb2.FileUploadResponse(is_ok=True)
+
+    def DownloadFile(self, request, context):
+        self.calls += 1
+        time.sleep(self.latency)
+        file_size = os.path.getsize(request.file_path)
+        with open(request.file_path, "rb") as file:
+            while True:
+                payload = file.read(request.chunk_size)
+                if not payload:
+                    break
+                self._transfer(len(payload))
+                yield mechanical_pb2.FileDownloadResponse(
+                    chunk=mechanical_pb2.Chunk(payload=payload, size=len(payload)),
+                    file_size=file_size,
+                )
+
+    def Shutdown(self, request, context):
+        self.calls += 1
+        return mechanical_pb2.ShutdownResponse()
+
+
+# %%
+# Start the stand-in server
+# ~~~~~~~~~~~~~~~~~~~~~~~~~
+# Start the server on a free local port with 2 ms of latency and 200 MB/s of
+# bandwidth, and connect a client to it as to any Mechanical instance.
+
+stand_in_directory = tempfile.mkdtemp()
+stand_in_service = StandInMechanical(stand_in_directory, latency=0.002, bandwidth=200 * 1024**2)
+stand_in_server = grpc.server(ThreadPoolExecutor(max_workers=4))
+mechanical_pb2_grpc.add_MechanicalServiceServicer_to_server(stand_in_service, stand_in_server)
+stand_in_port = stand_in_server.add_insecure_port("127.0.0.1:0")
+stand_in_server.start()
+
+stand_in = Mechanical(ip="127.0.0.1", port=stand_in_port, cleanup_on_exit=False)
+sessions = {"stand-in": stand_in}
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+#
+# Set ``use_mechanical`` to ``False`` to run the measurements against the
+# stand-in server only.
+
+use_mechanical = True
+
+if use_mechanical:
+    mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+    print(mechanical)
+    sessions["Mechanical"] = mechanical
+
+project_directories = {label: session.project_directory for label, session in sessions.items()}
+print(f"project directories = {project_directories}")
+
+# %%
+# Define a timing helper
+# ~~~~~~~~~~~~~~~~~~~~~~
+# Call a function several times and return the elapsed times in seconds.
+# The first call is discarded so that one-time setup costs do not skew the results.
+
+
+def measure(function, repeat=10):
+    """Return the elapsed times of ``repeat`` calls to ``function``."""
+    function()
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed.append(time.perf_counter() - start)
+    return np.array(elapsed)
+
+
+def report(label, elapsed):
+    """Print the median and 90th percentile of the elapsed times."""
+    median = np.median(elapsed) * 1000
+    p90 = np.percentile(elapsed, 90) * 1000
+    print(f"{label:<50} median {median:8.2f} ms   p90 {p90:8.2f} ms")
+
+
+# %%
+# Measure the round trip of an empty script
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# An empty script measures the fixed cost that every ``run_python_script`` call pays.
+
+for label, session in sessions.items():
+    report(
+        f"{label}: run_python_script('1')",
+        measure(lambda: session.run_python_script("1")),
+    )
+    report(f"{label}: list_files()", measure(session.list_files))
+
+# %%
+# Measure the cost of the script size
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Send scripts of increasing size. The script only assigns a string literal, so
+# the difference to the empty script is the cost of sending and parsing the text.
+
+script_sizes = [1_000, 10_000, 100_000, 1_000_000]
+script_medians = {label: [] for label in sessions}
+for label, session in sessions.items():
+    for size in script_sizes:
+        script = f"payload = '{'a' * size}'\nlen(payload)"
+        elapsed = measure(lambda: session.run_python_script(script), repeat=5)
+        report(f"{label}: run_python_script ({size} characters)", elapsed)
+        script_medians[label].append(np.median(elapsed) * 1000)
+
+# %%
+# Compare separate calls with one batched call
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Assign 50 variables with one call each, and then with a single script.
+# The difference is the number of round trips.
+
+n_statements = 50
+statements = [f"value_{index} = {index}" for index in range(n_statements)]
+
+for label, session in sessions.items():
+    report(
+        f"{label}: {n_statements} separate calls",
+        measure(
+            lambda: [session.run_python_script(statement) for statement in statements],
+            3,
+        ),
+    )
+    report(
+        f"{label}: 1 batched call",
+        measure(lambda: session.run_python_script("\n".join(statements)), 3),
+    )
+
+# %%
+# Measure the file transfer throughput
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Upload and download an 8 MB file with different chunk sizes.
+
+local_file_path = os.path.join(os.getcwd(), "round_trip_payload.bin")
+with open(local_file_path, "wb") as file:
+    file.write(os.urandom(8 * 1024 * 1024))
+file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
+
+download_directory = os.path.join(os.getcwd(), "round_trip_download")
+os.makedirs(download_directory, exist_ok=True)
+
+chunk_sizes = [64 * 1024, 256 * 1024, 1024 * 1024]
+upload_throughput = {label: [] for label in sessions}
+download_throughput = {label: [] for label in sessions}
+for label, session in sessions.items():
+    project_directory = project_directories[label]
+    server_file_path = os.path.join(project_directory, os.path.basename(local_file_path))
+    for chunk_size in chunk_sizes:
+        elapsed = measure(
+            lambda: session.upload(
+                file_name=local_file_path,
+                file_location_destination=project_directory,
+                chunk_size=chunk_size,
+                progress_bar=False,
+            ),
+            repeat=3,
+        )
+        upload_throughput[label].append(file_size_mb / np.median(elapsed))
+
+        elapsed = measure(
+            lambda: session.download(
+                server_file_path,
+                target_dir=download_directory,
+                chunk_size=chunk_size,
+                progress_bar=False,
+            ),
+            repeat=3,
+        )
+        download_throughput[label].append(file_size_mb / np.median(elapsed))
+
+        print(
+            f"{label}: chunk size {chunk_size // 1024:5d} kB: "
+            f"upload {upload_throughput[label][-1]:7.1f} MB/s, "
+            f"download {download_throughput[label][-1]:7.1f} MB/s"
+        )
+
+print(f"The stand-in server answered {stand_in_service.calls} calls")
+
+# %%
+# Plot the results
+# ~~~~~~~~~~~~~~~~
+
+fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
+for label in sessions:
+    ax1.loglog(script_sizes, script_medians[label], marker="o", label=label)
+    ax2.semilogx(chunk_sizes, upload_throughput[label], marker="o", label=f"{label} upload")
+    ax2.semilogx(chunk_sizes, download_throughput[label], marker="s", label=f"{label} download")
+ax1.set_xlabel("Script size [characters]")
+ax1.set_ylabel("Median round trip [ms]")
+ax1.set_title("run_python_script")
+ax1.legend()
+ax2.set_xlabel("Chunk size [bytes]")
+ax2.set_ylabel("Throughput [MB/s]")
+ax2.set_title("File transfer")
+ax2.legend()
+plt.show()
+
+# %%
+# Clean up the files
+# ~~~~~~~~~~~~~~~~~~
+# Remove the local files, stop the stand-in server, and clear the session.
+
+os.remove(local_file_path)
+shutil.rmtree(download_directory)
+stand_in_server.stop(grace=None)
+shutil.rmtree(stand_in_directory)
+
+if use_mechanical:
+    mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+if use_mechanical:
+    mechanical.exit()
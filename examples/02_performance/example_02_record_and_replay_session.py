@@ -0,0 +1,273 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_02_record_and_replay_session:
+
+Record and replay a session
+---------------------------
+
+This example wraps a Mechanical session in a recorder that writes every call,
+its payload sizes, its response, and its latency to a compact trace file.
+A replayer then serves the recorded responses without a Mechanical session,
+either at the recorded speed or faster. The same workflow function runs against
+both, so the client-side part of a workflow can be measured without a server,
+and traces recorded with different Mechanical versions can be compared.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import gzip
+import hashlib
+import json
+import os
+import time
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Define the recorder
+# ~~~~~~~~~~~~~~~~~~~
+# The recorder forwards each call to the session and appends one record per call.
+# Only a hash of the request is stored, so the trace stays small even when the
+# scripts are large. The trace is written as gzip-compressed JSON lines.
+
+
+def _request_hash(*parts):
+    return hashlib.sha256("\0".join(str(part) for part in parts).encode()).hexdigest()[:16]
+
+
+class SessionRecorder:
+    """Forward calls to a Mechanical session and record them."""
+
+    def __init__(self, mechanical):
+        self._mechanical = mechanical
+        self.records = []
+
+    def _record(self, call, request, request_size, function):
+        start = time.perf_counter()
+        response = function()
+        latency = time.perf_counter() - start
+        if call == "download":
+            response_size = sum(os.path.getsize(path) for path in response)
+        elif response is None:
+            response_size = 0
+        else:
+            response_size = len(str(response))
+        self.records.append(
+            {
+                "call": call,
+                "request": _request_hash(call, *request),
+                "request_size": request_size,
+                "response": response,
+                "response_size": response_size,
+                "latency": latency,
+            }
+        )
+        return response
+
+    @property
+    def project_directory(self):
+        return self._record("project_directory", (), 0, lambda: self._mechanical.project_directory)
+
+    def run_python_script(self, script_block):
+        return self._record(
+            "run_python_script",
+            (script_block,),
+            len(script_block),
+            lambda: self._mechanical.run_python_script(script_block),
+        )
+
+    def upload(self, file_name, file_location_destination=None):
+        return self._record(
+            "upload",
+            (os.path.basename(file_name), file_location_destination),
+            os.path.getsize(file_name),
+            lambda: self._mechanical.upload(
+                file_name=file_name,
+                file_location_destination=file_location_destination,
+                progress_bar=False,
+            ),
+        )
+
+    def download(self, files, target_dir=None):
+        return self._record(
+            "download",
+            (files,),
+            len(str(files)),
+            lambda: self._mechanical.download(files, target_dir=target_dir, progress_bar=False),
+        )
+
+    def list_files(self):
+        return self._record("list_files", (), 0, self._mechanical.list_files)
+
+    def save(self, trace_path):
+        """Write the records to a gzip-compressed JSON lines file."""
+        with gzip.open(trace_path, "wt", encoding="utf-8") as file:
+            for record in self.records:
+                file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+# %%
+# Define the replayer
+# ~~~~~~~~~~~~~~~~~~~
+# The replayer reads a trace and answers the same calls in the same order.
+# It checks that each request matches the recorded one, so a workflow that
+# changed since the recording fails early instead of returning wrong answers.
+# Set ``speed`` to replay faster than recorded, or to ``None`` to skip the waits.
+
+
+class SessionReplayer:
+    """Serve the responses recorded in a trace file."""
+
+    def __init__(self, trace_path, speed=1.0):
+        with gzip.open(trace_path, "rt", encoding="utf-8") as file:
+            self.records = [json.loads(line) for line in file]
+        self._speed = speed
+        self._position = 0
+
+    def _replay(self, call, request):
+        if self._position >= len(self.records):
+            raise RuntimeError(f"The trace has no record left for '{call}'.")
+        record = self.records[self._position]
+        if record["call"] != call or record["request"] != _request_hash(call, *request):
+            raise RuntimeError(
+                f"Call {self._position} does not match the trace: "
+                f"expected '{record['call']}', got '{call}'."
+            )
+        self._position += 1
+        if self._speed:
+            time.sleep(record["latency"] / self._speed)
+        return record["response"]
+
+    @property
+    def project_directory(self):
+        return self._replay("project_directory", ())
+
+    def run_python_script(self, script_block):
+        return self._replay("run_python_script", (script_block,))
+
+    def upload(self, file_name, file_location_destination=None):
+        return self._replay("upload", (os.path.basename(file_name), file_location_destination))
+
+    def download(self, files, target_dir=None):
+        return self._replay("download", (files,))
+
+    def list_files(self):
+        return self._replay("list_files", ())
+
+
+# %%
+# Define the workflow
+# ~~~~~~~~~~~~~~~~~~~
+# The workflow only uses the ``session`` argument, so it runs unchanged against
+# a live session, a recorder, or a replayer. It uploads the geometry and the
+# materials of the trace mapping example, imports them, and lists the bodies.
+
+input_files = {
+    "geometry_file_name": "example_09_pcb.agdb",
+    "fr4_material_file": "example_09_mat_fr4.xml",
+}
+local_paths = {
+    file_type: download_file(file_name, "pymechanical", "00_basic")
+    for file_type, file_name in input_files.items()
+}
+
+
+def run_workflow(session):
+    project_directory = session.project_directory
+    for file_type, file_path in local_paths.items():
+        session.upload(file_name=file_path, file_location_destination=project_directory)
+        server_path = os.path.join(project_directory, os.path.basename(file_path))
+        server_path = server_path.replace("\\", "\\\\")
+        session.run_python_script(f"{file_type} = '{server_path}'")
+
+    session.run_python_script("""
+geometry_import = Model.GeometryImportGroup.AddGeometryImport()
+geometry_import_format = Ansys.Mechanical.DataModel.Enums.GeometryImportPreference.Format.Automatic
+geometry_import.Import(geometry_file_name, geometry_import_format, None)
+Model.Materials.Import(fr4_material_file)
+""")
+    body_count = session.run_python_script(
+        "len(Model.Geometry.GetChildren(DataModelObjectCategory.Body, True))"
+    )
+    session.list_files()
+    return int(body_count)
+
+
+# %%
+# Launch mechanical and record the workflow
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+recorder = SessionRecorder(mechanical)
+start = time.perf_counter()
+recorded_body_count = run_workflow(recorder)
+recorded_time = time.perf_counter() - start
+print(f"Recorded {len(recorder.records)} calls in {recorded_time:.2f} s")
+
+trace_path = os.path.join(os.getcwd(), "trace_mapping_session.jsonl.gz")
+recorder.save(trace_path)
+print(f"Trace file: {trace_path} ({os.path.getsize(trace_path)} bytes)")
+
+# %%
+# Summarize the trace
+# ~~~~~~~~~~~~~~~~~~~
+# Print the request size, response size, and latency of each recorded call.
+
+for record in recorder.records:
+    print(
+        f"{record['call']:<20} request {record['request_size']:>10} B   "
+        f"response {record['response_size']:>8} B   latency {record['latency'] * 1000:8.1f} ms"
+    )
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# The replay does not need the session, so close the Mechanical instance now.
+
+mechanical.clear()
+mechanical.exit()
+
+# %%
+# Replay the workflow
+# ~~~~~~~~~~~~~~~~~~~
+# Replay the trace at the recorded speed, ten times faster, and without waiting.
+# The workflow returns the same result every time.
+
+for speed in [1.0, 10.0, None]:
+    replayer = SessionReplayer(trace_path, speed=speed)
+    start = time.perf_counter()
+    replayed_body_count = run_workflow(replayer)
+    elapsed = time.perf_counter() - start
+    assert replayed_body_count == recorded_body_count
+    print(f"Replayed at speed {speed}: {elapsed:.2f} s, {replayed_body_count} bodies")
+
+os.remove(trace_path)
@@ -0,0 +1,168 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_03_script_template:
+
+Send a parameterized script once
+--------------------------------
+
+Parametric studies often rebuild a large script with f-strings for every variant
+and send the whole text again. This example sends the script once as a function
+definition, so Mechanical compiles it once, and then calls the function with a
+small JSON payload of bound parameters for each variant.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import json
+import os
+import textwrap
+import time
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+# %%
+# Open the MECHDAT file
+# ~~~~~~~~~~~~~~~~~~~~~
+# Upload the MECHDAT file to the project directory and open it.
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+mechanical.upload(file_name=mechdat_path, file_location_destination=project_directory)
+
+base_name = os.path.basename(mechdat_path)
+combined_path = os.path.join(project_directory, base_name)
+mechdat_path_modified = combined_path.replace("\\", "\\\\")
+mechanical.run_python_script(f"mechdat_path='{mechdat_path_modified}'")
+mechanical.run_python_script("ExtAPI.DataModel.Project.Open(mechdat_path)")
+
+# %%
+# Define the script template
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+# A ``ScriptTemplate`` object wraps the script body in a function that takes a
+# ``params`` dictionary and defines it in the session once. Each call then only
+# sends the function name and the parameters, encoded as a JSON string literal.
+
+
+class ScriptTemplate:
+    """Script body defined once in a Mechanical session and called with parameters."""
+
+    def __init__(self, mechanical, name, body):
+        self._mechanical = mechanical
+        self.name = name
+        definition = f"import json\ndef {name}(params):\n{textwrap.indent(body, '    ')}"
+        self._mechanical.run_python_script(definition)
+        self.bytes_sent = len(definition)
+
+    def __call__(self, **params):
+        call = f"{self.name}(json.loads({json.dumps(json.dumps(params))}))"
+        self.bytes_sent += len(call)
+        return self._mechanical.run_python_script(call)
+
+
+# %%
+# Bind the parameters of a mesh study
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The template sets the global element size, regenerates the mesh, and returns
+# the mesh statistics. Only the element size changes between variants.
+
+mesh_study_body = """
+mesh = Model.Mesh
+mesh.ElementSize = Quantity(params["element_size"], params["unit"])
+mesh.GenerateMesh()
+return json.dumps({"nodes": mesh.Nodes, "elements": mesh.Elements})
+"""
+
+element_sizes = [10.0, 8.0, 6.0]
+
+start = time.perf_counter()
+mesh_study = ScriptTemplate(mechanical, "run_mesh_study", mesh_study_body)
+for element_size in element_sizes:
+    output = json.loads(mesh_study(element_size=element_size, unit="mm"))
+    print(f"element size {element_size} mm: {output['nodes']} nodes, {output['elements']} elements")
+template_time = time.perf_counter() - start
+
+# %%
+# Compare with interpolated scripts
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The usual approach sends the complete script with the values interpolated
+# for every variant.
+
+interpolated_bytes = 0
+start = time.perf_counter()
+for element_size in element_sizes:
+    script = f"""
+import json
+mesh = Model.Mesh
+mesh.ElementSize = Quantity({element_size}, "mm")
+mesh.GenerateMesh()
+json.dumps({{"nodes": mesh.Nodes, "elements": mesh.Elements}})
+"""
+    interpolated_bytes += len(script)
+    mechanical.run_python_script(script)
+interpolated_time = time.perf_counter() - start
+
+print(f"template:     {mesh_study.bytes_sent:6d} characters sent, {template_time:.2f} s")
+print(f"interpolated: {interpolated_bytes:6d} characters sent, {interpolated_time:.2f} s")
+
+# %%
+# With a short body like this one the difference is small, but it grows with the
+# size of the script and the number of variants. Scripts with thousands of lines,
+# such as the setup scripts of the technology showcase examples, are sent and
+# parsed once instead of once per variant.
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project.
+
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
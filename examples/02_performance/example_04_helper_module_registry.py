@@ -0,0 +1,208 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_04_helper_module_registry:
+
+Load helper modules once per session
+------------------------------------
+
+Sending a helper script with ``run_python_script_from_file`` uploads and runs the
+whole file on every call. This example uploads a helper module once, named after
+the hash of its content, imports it as a real module in the session, and then
+calls its functions by name. Loading the same module again, even from another
+client of the same session, only costs one check.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Write the helper module
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Functions in an imported module do not see the ``ExtAPI`` global of the
+# scripting session, so the helper functions take it as their first argument.
+
+helper_source = '''
+import json
+
+
+def count_objects(ext_api):
+    """Return the number of objects of each category in the tree."""
+    counts = {}
+    for obj in ext_api.DataModel.Tree.AllObjects:
+        category = str(obj.DataModelObjectCategory)
+        counts[category] = counts.get(category, 0) + 1
+    return json.dumps(counts)
+
+
+def find_objects(ext_api, name):
+    """Return the object IDs of the tree objects with the given name."""
+    ids = [obj.ObjectId for obj in ext_api.DataModel.Tree.AllObjects if obj.Name == name]
+    return json.dumps(ids)
+'''
+
+helper_path = os.path.join(os.getcwd(), "tree_helpers.py")
+with open(helper_path, "w") as file:
+    file.write(helper_source)
+
+# %%
+# Define the module registry
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The registry names each module after the hash of its content, so a changed
+# helper gets a new name and never collides with an old version. Before
+# uploading, it asks the session whether the module is already imported.
+
+
+class ModuleRegistry:
+    """Upload and import helper modules in a Mechanical session once."""
+
+    def __init__(self, mechanical):
+        self._mechanical = mechanical
+        self._loaded = set()
+        self.uploads = 0
+        self._module_directory = mechanical.project_directory
+        module_directory = self._module_directory.replace("\\", "\\\\")
+        mechanical.run_python_script(f"""
+import sys
+if '{module_directory}' not in sys.path:
+    sys.path.append('{module_directory}')
+""")
+
+    def load(self, path):
+        """Import the module at ``path`` in the session and return its name."""
+        with open(path, "rb") as file:
+            digest = hashlib.sha256(file.read()).hexdigest()[:12]
+        stem = os.path.splitext(os.path.basename(path))[0]
+        module_name = f"{stem}_{digest}"
+        if module_name in self._loaded:
+            return module_name
+
+        is_imported = self._mechanical.run_python_script(
+            f"import sys\n'{module_name}' in sys.modules"
+        )
+        if is_imported != "True":
+            with tempfile.TemporaryDirectory() as temp_directory:
+                module_path = os.path.join(temp_directory, f"{module_name}.py")
+                shutil.copyfile(path, module_path)
+                self._mechanical.upload(
+                    file_name=module_path,
+                    file_location_destination=self._module_directory,
+                    progress_bar=False,
+                )
+            self.uploads += 1
+        self._mechanical.run_python_script(f"import {module_name}")
+        self._loaded.add(module_name)
+        return module_name
+
+    def call(self, module_name, function_name, *args):
+        """Call a function of a loaded module with ``ExtAPI`` and JSON arguments."""
+        arguments = json.dumps(json.dumps(args))
+        return self._mechanical.run_python_script(
+            f"import json\n{module_name}.{function_name}(ExtAPI, *json.loads({arguments}))"
+        )
+
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+# %%
+# Open the MECHDAT file
+# ~~~~~~~~~~~~~~~~~~~~~
+# Upload the MECHDAT file to the project directory and open it.
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+mechanical.upload(file_name=mechdat_path, file_location_destination=project_directory)
+
+base_name = os.path.basename(mechdat_path)
+combined_path = os.path.join(project_directory, base_name)
+mechdat_path_modified = combined_path.replace("\\", "\\\\")
+mechanical.run_python_script(f"mechdat_path='{mechdat_path_modified}'")
+mechanical.run_python_script("ExtAPI.DataModel.Project.Open(mechdat_path)")
+
+# %%
+# Load the helper module and call its functions
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The first load uploads and imports the module.
+
+registry = ModuleRegistry(mechanical)
+tree_helpers = registry.load(helper_path)
+print(f"Loaded module {tree_helpers}, uploads so far: {registry.uploads}")
+
+counts = json.loads(registry.call(tree_helpers, "count_objects"))
+for category, count in sorted(counts.items()):
+    print(f"{category:<30} {count}")
+
+print(f"Solution objects: {registry.call(tree_helpers, 'find_objects', 'Solution')}")
+
+# %%
+# Load the module from a second client
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# A new registry, such as the one of another client of a pooled session, finds
+# the module already imported and does not upload it again.
+
+second_registry = ModuleRegistry(mechanical)
+second_registry.load(helper_path)
+print(f"Uploads by the second registry: {second_registry.uploads}")
+
+os.remove(helper_path)
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project.
+
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
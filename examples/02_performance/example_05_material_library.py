@@ -0,0 +1,195 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_05_material_library:
+
+Import only missing materials
+-----------------------------
+
+Each example uploads and imports its Engineering Data XML files again, even when
+the session already has the materials. This example parses the XML files once
+on the client, indexes the materials by name and content hash, and then pushes
+to a session only the materials that the session does not have.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Define the material library
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The library indexes each ``Material`` element of a file by the name in its
+# ``BulkDetails/Name`` element and by a hash of the element itself. A material
+# that appears again with the same content is skipped, and a material that
+# appears again with different content is reported. To push materials, the
+# library writes a copy of each source file that keeps only the missing
+# materials, so materials that the session already has are not imported again.
+
+
+def material_elements(root):
+    """Yield every ``Material`` element of a tree with its parent and name."""
+    for parent in root.iter():
+        for element in list(parent):
+            if element.tag.endswith("Material"):
+                name = element.findtext("BulkDetails/Name")
+                if name is not None:
+                    yield parent, element, name
+
+
+class MaterialLibrary:
+    """Index of Engineering Data materials by name and content hash."""
+
+    def __init__(self):
+        self.materials = {}
+
+    def add(self, path):
+        """Parse an Engineering Data XML file and index its materials."""
+        root = ET.parse(path).getroot()
+        for _, element, name in material_elements(root):
+            definition = copy.copy(element)
+            definition.tail = None
+            digest = hashlib.sha256(ET.tostring(definition)).hexdigest()
+            if name in self.materials:
+                if self.materials[name]["hash"] != digest:
+                    print(f"Skipping '{name}' from {path}: defined differently in another file.")
+                continue
+            self.materials[name] = {"path": path, "hash": digest}
+
+    def write_subset(self, path, names, target_directory):
+        """Write a copy of ``path`` that only defines the materials in ``names``."""
+        tree = ET.parse(path)
+        for parent, element, name in list(material_elements(tree.getroot())):
+            if name not in names or self.materials[name]["path"] != path:
+                parent.remove(element)
+        subset_path = os.path.join(target_directory, "subset_" + os.path.basename(path))
+        tree.write(subset_path, encoding="utf-8", xml_declaration=True)
+        return subset_path
+
+    def push(self, mechanical):
+        """Import the materials that the session does not have yet."""
+        existing = json.loads(mechanical.run_python_script("""
+import json
+json.dumps([material.Name for material in Model.Materials.Children])
+"""))
+        missing = sorted(set(self.materials) - set(existing))
+        paths = sorted({self.materials[name]["path"] for name in missing})
+        if not paths:
+            return []
+
+        project_directory = mechanical.project_directory
+        server_paths = []
+        with tempfile.TemporaryDirectory() as subset_directory:
+            for path in paths:
+                subset_path = self.write_subset(path, missing, subset_directory)
+                mechanical.upload(
+                    file_name=subset_path,
+                    file_location_destination=project_directory,
+                    progress_bar=False,
+                )
+                server_paths.append(os.path.join(project_directory, os.path.basename(subset_path)))
+        mechanical.run_python_script(f"""
+import json
+for path in json.loads({json.dumps(json.dumps(server_paths))}):
+    Model.Materials.Import(path)
+""")
+        return missing
+
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the material files of the bolt pretension and wear examples. Both
+# examples define a copper and a steel material.
+
+material_files = [
+    "example_06_Mat_Copper.xml",
+    "example_06_Mat_Steel.xml",
+    "example_07_Mat_Copper.xml",
+    "example_07_Mat_Steel.xml",
+]
+
+library = MaterialLibrary()
+material_paths = []
+for file_name in material_files:
+    file_path = download_file(file_name, "pymechanical", "00_basic")
+    print(f"Downloaded the material file to: {file_path}")
+    library.add(file_path)
+    material_paths.append(file_path)
+
+for name, entry in library.materials.items():
+    print(f"{name:<20} {entry['hash'][:12]}  {os.path.basename(entry['path'])}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+# %%
+# Push the materials to the session
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Import the copper file of the bolt pretension example the usual way first.
+# The first push then uploads and imports only the materials that the session
+# does not have yet. The second push finds every material in the session and
+# transfers nothing.
+
+project_directory = mechanical.project_directory
+mechanical.upload(file_name=material_paths[0], file_location_destination=project_directory)
+copper_path = os.path.join(project_directory, os.path.basename(material_paths[0]))
+copper_path_modified = copper_path.replace("\\", "\\\\")
+mechanical.run_python_script(f"Model.Materials.Import('{copper_path_modified}')")
+
+imported = library.push(mechanical)
+print(f"First push imported: {imported}")
+
+imported = library.push(mechanical)
+print(f"Second push imported: {imported}")
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project.
+
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
@@ -0,0 +1,203 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_06_compare_model_snapshots:
+
+Compare two snapshots of a model
+--------------------------------
+
+This example finds what changed between two states of a model without
+transferring all of their properties. The session keeps each snapshot in memory
+and only returns a hash of the properties of each tree object. The client compares
+the hashes and then requests the full properties of the objects that differ.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import json
+import os
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+# %%
+# Open the MECHDAT file
+# ~~~~~~~~~~~~~~~~~~~~~
+# Upload the MECHDAT file to the project directory and open it.
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+mechanical.upload(file_name=mechdat_path, file_location_destination=project_directory)
+
+base_name = os.path.basename(mechdat_path)
+combined_path = os.path.join(project_directory, base_name)
+mechdat_path_modified = combined_path.replace("\\", "\\\\")
+mechanical.run_python_script(f"mechdat_path='{mechdat_path_modified}'")
+mechanical.run_python_script("ExtAPI.DataModel.Project.Open(mechdat_path)")
+
+# %%
+# Define the snapshot functions
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define the functions in the session once. A snapshot walks the tree, as the
+# :ref:`ref_example_03_show_object_properties` example does, and stores the
+# visible properties of each object under its tree path. Objects with the same
+# name under the same parent get an index, so paths are unique and stable
+# across models. ``store_snapshot`` returns only one hash per object, and
+# ``get_properties`` returns the full properties of the requested paths.
+
+mechanical.run_python_script("""
+import hashlib
+import json
+
+def walk(obj, path):
+    yield obj, path
+    seen = {}
+    for child in obj.Children:
+        seen[child.Name] = seen.get(child.Name, 0) + 1
+        child_path = path + "/" + child.Name
+        if seen[child.Name] > 1:
+            child_path += "[%d]" % seen[child.Name]
+        for item in walk(child, child_path):
+            yield item
+
+def hash_properties(properties):
+    text = "\\n".join("%s=%s" % (caption, value) for caption, value in properties)
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+snapshots = {}
+
+def store_snapshot(name):
+    snapshot = {}
+    for obj, path in walk(Model, Model.Name):
+        properties = []
+        if hasattr(obj, "VisibleProperties"):
+            properties = [(prop.Caption, prop.StringValue) for prop in obj.VisibleProperties]
+        snapshot[path] = properties
+    snapshots[name] = snapshot
+    return json.dumps(dict((path, hash_properties(properties))
+                           for path, properties in snapshot.items()))
+
+def get_properties(name, paths):
+    return json.dumps(dict((path, snapshots[name][path]) for path in paths))
+""")
+
+# %%
+# Take the first snapshot
+# ~~~~~~~~~~~~~~~~~~~~~~~
+
+before_payload = mechanical.run_python_script("store_snapshot('before')")
+before = json.loads(before_payload)
+print(f"Snapshot 'before': {len(before)} objects, {len(before_payload)} characters")
+
+# %%
+# Change the model and take the second snapshot
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Change the number of steps of the analysis and add a fixed support. In
+# practice, the second snapshot can also come from another MECHDAT file opened
+# in the same session.
+
+mechanical.run_python_script("""
+analysis = Model.Analyses[0]
+analysis.AnalysisSettings.NumberOfSteps = 2
+analysis.AddFixedSupport()
+""")
+
+after_payload = mechanical.run_python_script("store_snapshot('after')")
+after = json.loads(after_payload)
+print(f"Snapshot 'after': {len(after)} objects, {len(after_payload)} characters")
+
+# %%
+# Compare the hashes
+# ~~~~~~~~~~~~~~~~~~
+# Compare the hashes on the client to find the added, removed, and changed
+# objects.
+
+added = sorted(set(after) - set(before))
+removed = sorted(set(before) - set(after))
+changed = sorted(path for path in set(before) & set(after) if before[path] != after[path])
+print(f"added: {added}")
+print(f"removed: {removed}")
+print(f"changed: {changed}")
+
+# %%
+# Fetch the properties of the objects that differ
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Request the full properties only for the changed objects and print the
+# properties whose values differ.
+
+
+def get_properties(snapshot_name, paths):
+    """Return the properties of the given paths as a dictionary per path."""
+    arguments = json.dumps(json.dumps(paths))
+    output = mechanical.run_python_script(
+        f"get_properties('{snapshot_name}', json.loads({arguments}))"
+    )
+    return {path: dict(properties) for path, properties in json.loads(output).items()}
+
+
+old_properties = get_properties("before", changed)
+new_properties = get_properties("after", changed + added)
+
+for path in changed:
+    old, new = old_properties[path], new_properties[path]
+    for caption in sorted(set(old) | set(new)):
+        if old.get(caption) != new.get(caption):
+            print(f"{path}: {caption}: {old.get(caption)!r} -> {new.get(caption)!r}")
+
+for path in added:
+    print(f"{path}: added with {len(new_properties[path])} properties")
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project.
+
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
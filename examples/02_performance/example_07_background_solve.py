@@ -0,0 +1,247 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_07_background_solve:
+
+Solve in the background and poll the status
+-------------------------------------------
+
+A ``Solve(True)`` call blocks the ``run_python_script`` call until the solve
+finishes, so the client cannot do anything else and long solves can run into
+gRPC deadlines. This example starts the solve with ``Solve(False)``, which returns
+immediately, and wraps the running solve in a handle that polls its status and
+solver progress and can cancel the solve. One client can start solves in several
+sessions and wait for all of them.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import json
+import os
+import time
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Define the solve handle
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# The handle starts the solve of one analysis and returns at once. Each call
+# to ``status`` is one short script that reads the ``Status`` and ``ObjectState``
+# properties of the solution and the progress of the solver. The progress is
+# the last completed load step, substep, and time in the ``solve.out`` file of
+# the solver, which is read from its end.
+#
+# ``cancel`` asks the solver to stop by writing a ``file.abt`` abort file with
+# the ``nonlinear`` keyword to the solver directory, which stops a nonlinear
+# solve after the current iteration. A linear solve ignores the abort file and
+# runs to its end. ``cancel`` then waits for the solve to end, clears the
+# generated data, and makes later calls to ``wait`` return at once.
+
+progress_script = r"""
+import json
+import os
+import re
+
+def solve_progress(solution, tail_size=65536):
+    progress = {"load_step": None, "substep": None, "time": None}
+    solve_out = os.path.join(solution.WorkingDir, "solve.out")
+    if not os.path.isfile(solve_out):
+        return progress
+    with open(solve_out, "rb") as file:
+        file.seek(max(0, os.path.getsize(solve_out) - tail_size))
+        text = file.read().decode("utf-8", "replace")
+    for match in re.finditer(r"LOAD STEP\s+(\d+)\s+SUBSTEP\s+(\d+)\s+COMPLETED", text):
+        progress["load_step"], progress["substep"] = int(match.group(1)), int(match.group(2))
+    for match in re.finditer(r"\*\*\* TIME =\s+(\S+)", text):
+        progress["time"] = float(match.group(1))
+    return progress
+
+def solve_status(solution):
+    return json.dumps({"status": str(solution.Status), "state": str(solution.ObjectState),
+                       "progress": solve_progress(solution)})
+
+def request_abort(solution):
+    with open(os.path.join(solution.WorkingDir, "file.abt"), "w") as file:
+        file.write("nonlinear\n")
+"""
+
+
+class SolveHandle:
+    """Handle to a solve running in a Mechanical session."""
+
+    def __init__(self, mechanical, analysis_index=0):
+        self._mechanical = mechanical
+        self._solution = f"Model.Analyses[{analysis_index}].Solution"
+        self._cancelled = False
+        self._start = time.perf_counter()
+        mechanical.run_python_script(f"{progress_script}\n{self._solution}.Solve(False)")
+
+    def status(self):
+        """Return the solution status, object state, and solver progress."""
+        status = json.loads(self._mechanical.run_python_script(f"solve_status({self._solution})"))
+        status["elapsed"] = time.perf_counter() - self._start
+        return status
+
+    def done(self, status=None):
+        """Return whether the solve has finished, successfully or not.
+
+        Pass a result of ``status`` to decide without another call.
+        """
+        if self._cancelled:
+            return True
+        if status is None:
+            status = self.status()
+        return status["status"] == "Done" or status["state"] in ("Solved", "SolveFailed")
+
+    def wait(self, timeout=None, interval=2.0):
+        """Poll the status until the solve finishes or ``timeout`` seconds pass."""
+        start = time.perf_counter()
+        while True:
+            status = self.status()
+            if self.done(status):
+                return status
+            if timeout is not None and time.perf_counter() - start > timeout:
+                raise TimeoutError(f"The solve did not finish within {timeout} s.")
+            time.sleep(interval)
+
+    def cancel(self, timeout=None, interval=2.0):
+        """Stop the solve, wait for it to end, and clear the generated data."""
+        if self._cancelled:
+            return
+        self._mechanical.run_python_script(f"request_abort({self._solution})")
+        self.wait(timeout, interval)
+        self._mechanical.run_python_script(f"{self._solution}.ClearGeneratedData()")
+        self._cancelled = True
+
+
+def describe(status):
+    """Format a result of ``SolveHandle.status`` on one line."""
+    progress = status["progress"]
+    return (
+        f"{status['elapsed']:6.1f} s: {status['status']}, {status['state']}, "
+        f"load step {progress['load_step']}, substep {progress['substep']}, "
+        f"time {progress['time']}"
+    )
+
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+# %%
+# Open the MECHDAT file
+# ~~~~~~~~~~~~~~~~~~~~~
+# Upload the MECHDAT file to the project directory, open it, and clear the
+# stored results so the analysis has to be solved again.
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+mechanical.upload(file_name=mechdat_path, file_location_destination=project_directory)
+
+base_name = os.path.basename(mechdat_path)
+combined_path = os.path.join(project_directory, base_name)
+mechdat_path_modified = combined_path.replace("\\", "\\\\")
+mechanical.run_python_script(f"mechdat_path='{mechdat_path_modified}'")
+mechanical.run_python_script("""
+ExtAPI.DataModel.Project.Open(mechdat_path)
+Model.Analyses[0].Solution.ClearGeneratedData()
+""")
+
+# %%
+# Start the solve and poll the status
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The client is free while the solve runs. Here it only prints the status and
+# the progress of the solver, but it could start solves in other sessions or
+# process earlier results.
+
+solve = SolveHandle(mechanical)
+for _ in range(5):
+    status = solve.status()
+    if solve.done(status):
+        break
+    print(describe(status))
+    time.sleep(2.0)
+
+# %%
+# Wait for the solve
+# ~~~~~~~~~~~~~~~~~~
+# ``wait`` blocks with a timeout, measured from the call to ``wait``, instead of
+# relying on the gRPC deadline of a single long call. It returns after one
+# status call if the solve already finished.
+
+status = solve.wait(timeout=600)
+print(f"Solve finished: {describe(status)}")
+
+output = mechanical.run_python_script("""
+import json
+results = Model.Analyses[0].Solution.Children
+json.dumps(dict((result.Name, str(result.Maximum)) for result in results
+                if hasattr(result, "Maximum")))
+""")
+print(output)
+
+# %%
+# Cancel a solve
+# ~~~~~~~~~~~~~~
+# Start the solve again and cancel it. ``cancel`` returns once the solver has
+# stopped and the generated data is cleared. The model is then back in the
+# state it had before the solve.
+
+solve = SolveHandle(mechanical)
+print(describe(solve.status()))
+solve.cancel(timeout=600)
+print(f"Solve cancelled, done: {solve.done()}")
+state = mechanical.run_python_script("str(Model.Analyses[0].Solution.ObjectState)")
+print(f"Solution state after the cancel: {state}")
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project.
+
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
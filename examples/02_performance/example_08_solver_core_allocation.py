@@ -0,0 +1,181 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_08_solver_core_allocation:
+
+Allocate solver cores per session
+---------------------------------
+
+By default each solve uses the core count of the default solve configuration,
+so several sessions on the same node can oversubscribe its CPUs. This example
+applies a solver resource profile to a session before the solve, derives the
+core count from the number of sessions that share the node, and measures the
+solve time for several core counts to find the best one for a model.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import json
+import os
+import time
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+from matplotlib import pyplot as plt
+
+# %%
+# Define the resource profile
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The profile sets the maximum number of cores and whether the solve runs in
+# distributed or shared memory mode. It is applied to the ``My Computer``
+# solve configuration, which the local solves of the session use. The solve
+# configuration belongs to the application, not to the project, so it stays
+# set for everything that later solves in the same instance. Read the current
+# profile first to restore it afterwards.
+
+
+def read_solver_profile(mechanical):
+    """Return the solver core count and memory mode of a session."""
+    output = mechanical.run_python_script("""
+import json
+config = ExtAPI.Application.SolveConfigurations["My Computer"]
+json.dumps([config.SolveProcessSettings.MaxNumberOfCores,
+            config.SolveProcessSettings.DistributeSolution])
+""")
+    cores, distributed = json.loads(output)
+    return cores, distributed
+
+
+def apply_solver_profile(mechanical, cores, distributed=False):
+    """Set the solver core count and memory mode of a session."""
+    mechanical.run_python_script(f"""
+config = ExtAPI.Application.SolveConfigurations["My Computer"]
+config.SolveProcessSettings.MaxNumberOfCores = {int(cores)}
+config.SolveProcessSettings.DistributeSolution = {bool(distributed)}
+""")
+
+
+def cores_per_session(mechanical, sessions_per_node):
+    """Split the cores of the node of a session evenly between its sessions."""
+    node_cores = int(
+        mechanical.run_python_script("import System\nSystem.Environment.ProcessorCount")
+    )
+    return node_cores, max(1, node_cores // sessions_per_node)
+
+
+def timed_solve(mechanical):
+    """Clear the results, solve the first analysis, and return the solve time."""
+    mechanical.run_python_script("Model.Analyses[0].Solution.ClearGeneratedData()")
+    start = time.perf_counter()
+    mechanical.run_python_script("Model.Analyses[0].Solution.Solve(True)")
+    return time.perf_counter() - start
+
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+# %%
+# Open the MECHDAT file
+# ~~~~~~~~~~~~~~~~~~~~~
+# Upload the MECHDAT file to the project directory and open it.
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+mechanical.upload(file_name=mechdat_path, file_location_destination=project_directory)
+
+base_name = os.path.basename(mechdat_path)
+combined_path = os.path.join(project_directory, base_name)
+mechdat_path_modified = combined_path.replace("\\", "\\\\")
+mechanical.run_python_script(f"mechdat_path='{mechdat_path_modified}'")
+mechanical.run_python_script("ExtAPI.DataModel.Project.Open(mechdat_path)")
+
+# %%
+# Solve with the profiles
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# A scheduler that places two sessions on this node gives each of them half
+# of the cores. Solve the model with this profile first. Then solve it with
+# 1, 2, 4, ... cores, up to the cores of the node, to find the best core count
+# for the model. Clear the results before each solve so that every solve starts
+# from scratch. Restore the original profile when the solves finish or fail.
+
+original_cores, original_distributed = read_solver_profile(mechanical)
+print(f"Original profile: {original_cores} cores, distributed={original_distributed}")
+
+
+node_cores, cores = cores_per_session(mechanical, sessions_per_node=2)
+print(f"The node has {node_cores} cores, each of 2 sessions gets {cores}")
+
+try:
+    apply_solver_profile(mechanical, cores, distributed=False)
+    print(f"Shared node profile: {timed_solve(mechanical):6.1f} s")
+
+    core_counts = [2**power for power in range(8) if 2**power <= node_cores]
+    solve_times = []
+    for core_count in core_counts:
+        apply_solver_profile(mechanical, core_count)
+        solve_times.append(timed_solve(mechanical))
+        print(f"{core_count:3d} cores: {solve_times[-1]:6.1f} s")
+finally:
+    apply_solver_profile(mechanical, original_cores, original_distributed)
+
+best_cores = core_counts[solve_times.index(min(solve_times))]
+print(f"Best core count for this model: {best_cores}")
+
+plt.figure(figsize=(8, 5))
+plt.bar([str(core_count) for core_count in core_counts], solve_times)
+plt.xlabel("Cores")
+plt.ylabel("Solve time [s]")
+plt.title("Solve time per core count")
+plt.show()
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project.
+
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
@@ -0,0 +1,207 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_09_solve_analyses_in_parallel:
+
+Solve independent analyses in parallel
+--------------------------------------
+
+A model with several independent analyses, such as a static and a modal
+analysis, is usually solved one analysis after another. This example prepares
+the model once, copies it to each available session, solves a different analysis
+in each session at the same time, and collects the scalar results, output files,
+and result files into one report. The total time is then bounded by the slowest
+analysis.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+from ansys.mechanical.core.mechanical import get_start_instance
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch two new Mechanical sessions in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close these Mechanical sessions when finished,
+# this example must call  the ``mechanical.exit()`` method of each session.
+#
+# When ``PYMECHANICAL_START_INSTANCE`` is ``FALSE``, as in the documentation
+# build, ``launch_mechanical`` connects to the one running instance instead of
+# starting a new one. The second session is then skipped, and the analyses are
+# solved one after another on the single session instead of in parallel.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+if get_start_instance():
+    sessions = [mechanical, launch_mechanical(batch=True, cleanup_on_exit=False)]
+else:
+    sessions = [mechanical]
+    print("Only one Mechanical instance is available. Skipping the parallel solve.")
+print(f"Solving on {len(sessions)} sessions")
+
+# Write the downloaded files to a temporary directory, which is removed at the
+# end of the example.
+work_directory = tempfile.mkdtemp()
+
+# %%
+# Prepare the model
+# ~~~~~~~~~~~~~~~~~
+# Open the bolt model, add a modal analysis next to its static analysis, and
+# save the prepared model. Download it so it can be copied to every session.
+
+
+def open_mechdat(session, path):
+    """Upload a MECHDAT file to a session and open it."""
+    project_directory = session.project_directory
+    session.upload(file_name=path, file_location_destination=project_directory)
+    server_path = os.path.join(project_directory, os.path.basename(path))
+    server_path = server_path.replace("\\", "\\\\")
+    session.run_python_script(f"ExtAPI.DataModel.Project.Open('{server_path}')")
+
+
+open_mechdat(mechanical, mechdat_path)
+output = mechanical.run_python_script("""
+import os
+
+modal = Model.AddModalAnalysis()
+modal.Solution.AddTotalDeformation()
+
+prepared_path = os.path.join(ExtAPI.DataModel.Project.ProjectDirectory, "prepared_model.mechdat")
+ExtAPI.DataModel.Project.Save(prepared_path)
+prepared_path
+""")
+prepared_model_path = mechanical.download(output, target_dir=work_directory)[0]
+analysis_count = int(mechanical.run_python_script("Model.Analyses.Count"))
+print(f"Prepared model with {analysis_count} analyses: {prepared_model_path}")
+
+# %%
+# Define the solve task
+# ~~~~~~~~~~~~~~~~~~~~~
+# Each task opens the prepared model in its session, solves one analysis, and
+# returns the maximum of each of its results. It downloads the ``solve.out``
+# file and the result files of the analysis to a directory of its own. A
+# session that gets several analyses solves them one after another.
+
+
+def solve_analysis(session, analysis_index):
+    """Solve one analysis of the prepared model and return its results."""
+    open_mechdat(session, prepared_model_path)
+    start = time.perf_counter()
+    output = session.run_python_script(f"""
+import json
+import os
+
+analysis = Model.Analyses[{analysis_index}]
+analysis.Solution.Solve(True)
+results = dict((result.Name, str(result.Maximum)) for result in analysis.Solution.Children
+               if hasattr(result, "Maximum"))
+files = [os.path.join(analysis.WorkingDir, name) for name in os.listdir(analysis.WorkingDir)
+         if name == "solve.out" or name.endswith(".rst")]
+json.dumps({{"name": analysis.Name, "results": results, "files": files}})
+""")
+    report = json.loads(output)
+    report["solve_time"] = time.perf_counter() - start
+
+    target_dir = os.path.join(work_directory, f"analysis_{analysis_index}")
+    os.makedirs(target_dir, exist_ok=True)
+    report["files"] = session.download(report["files"], target_dir=target_dir)
+    return report
+
+
+def solve_on_session(session, analysis_indices):
+    return [solve_analysis(session, analysis_index) for analysis_index in analysis_indices]
+
+
+# %%
+# Solve the analyses
+# ~~~~~~~~~~~~~~~~~~
+# Distribute the analyses round-robin over the sessions and solve them in one
+# thread per session.
+
+analysis_indices = list(range(analysis_count))
+assignments = [analysis_indices[index :: len(sessions)] for index in range(len(sessions))]
+
+start = time.perf_counter()
+with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+    futures = [
+        executor.submit(solve_on_session, session, indices)
+        for session, indices in zip(sessions, assignments)
+    ]
+    reports = [report for future in futures for report in future.result()]
+total_time = time.perf_counter() - start
+
+# %%
+# Merge the reports
+# ~~~~~~~~~~~~~~~~~
+# Merge the results of all analyses into one report and write it next to the
+# downloaded output and result files.
+
+merged_report = {
+    "total_time": total_time,
+    "analyses": {report.pop("name"): report for report in reports},
+}
+report_path = os.path.join(work_directory, "analyses_report.json")
+with open(report_path, "w") as file:
+    json.dump(merged_report, file, indent=1)
+
+print(json.dumps(merged_report, indent=1))
+slowest = max(report["solve_time"] for report in merged_report["analyses"].values())
+print(f"Total time {total_time:.1f} s, slowest analysis {slowest:.1f} s")
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project, and remove the downloaded
+# files.
+
+for session in sessions:
+    session.clear()
+shutil.rmtree(work_directory)
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instances.
+
+for session in sessions:
+    session.exit()
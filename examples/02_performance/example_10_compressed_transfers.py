@@ -0,0 +1,235 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_10_compressed_transfers:
+
+Compress file transfers
+-----------------------
+
+Text files such as ``solve.out`` and material XML files compress very well, but
+``upload`` and ``download`` send them as they are. This example compresses large
+files that compress well with gzip before the transfer: on the client before an
+upload, and on the server before a download. The other side decompresses them.
+The transfer statistics show the bytes that were actually sent in each direction.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+# %%
+# Decide when to compress
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Compressing costs CPU time on both sides, so it only pays off for large files
+# that compress well. Files smaller than ``compression_threshold`` are sent as
+# they are. For larger files, estimate the compression ratio from the first
+# megabyte of the file and compress only when it reaches ``minimum_ratio``.
+# The server applies the same rule before a download.
+
+compression_threshold = 1024 * 1024
+minimum_ratio = 2.0
+
+
+def compression_ratio(path, sample_size=1024 * 1024):
+    """Estimate the gzip compression ratio from the start of a file."""
+    with open(path, "rb") as file:
+        sample = file.read(sample_size)
+    return len(sample) / max(1, len(gzip.compress(sample, compresslevel=1)))
+
+
+def should_compress(path):
+    """Return whether a file is worth compressing before the transfer."""
+    return os.path.getsize(path) >= compression_threshold and (
+        compression_ratio(path) >= minimum_ratio
+    )
+
+
+# %%
+# Define the compressed transfers
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define functions in the session that compress a file when it is worth it and
+# decompress an uploaded file. The client functions return the number of bytes
+# that were sent and the time the transfer took, including the compression.
+
+mechanical.run_python_script(f"""
+import gzip
+import json
+import os
+import shutil
+import zlib
+
+def gzip_file(path, threshold={compression_threshold}, minimum_ratio={minimum_ratio}):
+    size = os.path.getsize(path)
+    if size >= threshold:
+        with open(path, "rb") as file:
+            sample = file.read(1024 * 1024)
+        if len(sample) >= minimum_ratio * len(zlib.compress(sample, 1)):
+            with open(path, "rb") as source:
+                with gzip.open(path + ".gz", "wb") as target:
+                    shutil.copyfileobj(source, target)
+            return json.dumps({{"path": path + ".gz", "size": size, "compressed": True}})
+    return json.dumps({{"path": path, "size": size, "compressed": False}})
+
+def gunzip_file(path):
+    with gzip.open(path, "rb") as source:
+        with open(path[:-3], "wb") as target:
+            shutil.copyfileobj(source, target)
+    os.remove(path)
+""")
+
+
+def upload_plain(client, path, target_directory):
+    """Upload a file as it is and return the bytes sent and time."""
+    start = time.perf_counter()
+    client.upload(file_name=path, file_location_destination=target_directory, progress_bar=False)
+    return os.path.getsize(path), time.perf_counter() - start
+
+
+def download_plain(client, server_path, target_dir):
+    """Download a file as it is and return the bytes received and time."""
+    start = time.perf_counter()
+    local_path = client.download(server_path, target_dir=target_dir, progress_bar=False)[0]
+    return os.path.getsize(local_path), time.perf_counter() - start
+
+
+def upload_compressed(client, path, target_directory):
+    """Upload a file, compressed when it is worth it, and return the bytes sent and time."""
+    if not should_compress(path):
+        return upload_plain(client, path, target_directory)
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as compressed_directory:
+        compressed_path = os.path.join(compressed_directory, os.path.basename(path) + ".gz")
+        with open(path, "rb") as source, gzip.open(compressed_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        client.upload(
+            file_name=compressed_path,
+            file_location_destination=target_directory,
+            progress_bar=False,
+        )
+        sent = os.path.getsize(compressed_path)
+    server_path = os.path.join(target_directory, os.path.basename(compressed_path))
+    client.run_python_script(f"gunzip_file({json.dumps(server_path)})")
+    return sent, time.perf_counter() - start
+
+
+def download_compressed(client, server_path, target_dir):
+    """Download a file, compressed when it is worth it, and return the bytes received and time."""
+    start = time.perf_counter()
+    transfer = json.loads(client.run_python_script(f"gzip_file({json.dumps(server_path)})"))
+    local_path = client.download(transfer["path"], target_dir=target_dir, progress_bar=False)[0]
+    received = os.path.getsize(local_path)
+    if transfer["compressed"]:
+        client.run_python_script(f"os.remove({json.dumps(transfer['path'])})")
+        with gzip.open(local_path, "rb") as source, open(local_path[:-3], "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(local_path)
+    return received, time.perf_counter() - start
+
+
+# %%
+# Prepare the files
+# ~~~~~~~~~~~~~~~~~
+# Use a material XML file, a large text file similar to a ``solve.out`` file,
+# and a file of random bytes that cannot be compressed.
+
+material_path = download_file("example_06_Mat_Steel.xml", "pymechanical", "00_basic")
+
+work_directory = tempfile.mkdtemp()
+text_path = os.path.join(work_directory, "solver_output.txt")
+with open(text_path, "w") as file:
+    for iteration in range(200_000):
+        value = 1.0 / (iteration + 1)
+        file.write(f"    FORCE CONVERGENCE VALUE  =  {value:.4E}    CRITERION=  0.1000E-01\n")
+
+binary_path = os.path.join(work_directory, "random_payload.bin")
+with open(binary_path, "wb") as file:
+    file.write(os.urandom(8 * 1024 * 1024))
+
+file_paths = [material_path, text_path, binary_path]
+
+# %%
+# Compare the transfers
+# ~~~~~~~~~~~~~~~~~~~~~
+# Upload and download each file as it is and with compression, and print the
+# bytes sent in each direction and the transfer rate of the file contents.
+
+download_directory = os.path.join(work_directory, "download")
+os.makedirs(download_directory)
+
+
+methods = [
+    ("plain", upload_plain, download_plain),
+    ("gzip", upload_compressed, download_compressed),
+]
+for path in file_paths:
+    size = os.path.getsize(path)
+    server_path = os.path.join(project_directory, os.path.basename(path))
+    print(f"{os.path.basename(path)}: {size} bytes, ratio {compression_ratio(path):.1f}")
+    for label, upload, download in methods:
+        sent, upload_time = upload(mechanical, path, project_directory)
+        received, download_time = download(mechanical, server_path, download_directory)
+        print(
+            f"    {label:<6} upload {sent:10d} bytes {upload_time * 1000:8.1f} ms "
+            f"({size / upload_time / 1024**2:7.1f} MB/s)   "
+            f"download {received:10d} bytes {download_time * 1000:8.1f} ms "
+            f"({size / download_time / 1024**2:7.1f} MB/s)"
+        )
+
+# %%
+# Clean up the files
+# ~~~~~~~~~~~~~~~~~~
+# Remove the local files and clear the session.
+
+shutil.rmtree(work_directory)
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
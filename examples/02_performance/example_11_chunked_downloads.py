@@ -0,0 +1,225 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_11_chunked_downloads:
+
+Download large files in verified chunks
+---------------------------------------
+
+A dropped connection during ``download`` restarts the transfer of a large result
+file from the beginning. This example splits the file into parts on the server
+and records a checksum for each part. The client downloads the parts with several
+connections at once, verifies each part, and skips the parts it already has when
+the download is resumed.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+import shutil
+
+from ansys.mechanical.core import Mechanical, launch_mechanical
+from ansys.mechanical.core.examples import download_file
+from ansys.mechanical.core.mechanical import MAX_MESSAGE_LENGTH
+import grpc
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model. It stands in for a large
+# result file on the server.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+mechanical.upload(file_name=mechdat_path, file_location_destination=project_directory)
+server_file_path = os.path.join(project_directory, os.path.basename(mechdat_path))
+
+# %%
+# Split the file on the server
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define a function in the session that splits a file into parts of a given
+# size and returns a manifest with the size and MD5 checksum of every part
+# and of the whole file. The parts take as much disk space as the file itself
+# until they are removed. Split the file into eight parts, and into 64 MB
+# parts when it is larger than 512 MB.
+
+mechanical.run_python_script("""
+import hashlib
+import json
+import os
+
+def split_file(path, chunk_size):
+    parts = []
+    whole = hashlib.md5()
+    with open(path, "rb") as source:
+        while True:
+            data = source.read(chunk_size)
+            if not data:
+                break
+            whole.update(data)
+            part_path = "%s.part%04d" % (path, len(parts))
+            with open(part_path, "wb") as part:
+                part.write(data)
+            parts.append({"path": part_path, "size": len(data),
+                          "md5": hashlib.md5(data).hexdigest()})
+    return json.dumps({"size": sum(part["size"] for part in parts),
+                       "md5": whole.hexdigest(), "parts": parts})
+
+def remove_parts(manifest):
+    for part in json.loads(manifest)["parts"]:
+        os.remove(part["path"])
+""")
+
+server_path = server_file_path.replace("\\", "\\\\")
+part_size = min(64 * 1024 * 1024, -(-os.path.getsize(mechdat_path) // 8))
+manifest_json = mechanical.run_python_script(f"split_file('{server_path}', {part_size})")
+manifest = json.loads(manifest_json)
+print(f"{manifest['size']} bytes in {len(manifest['parts'])} parts")
+
+# %%
+# Define the chunked download
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Each worker has its own client of the same instance, so the parts are
+# downloaded in parallel. A part that is already present locally with the
+# right checksum is skipped. A part with the wrong checksum is downloaded
+# again, up to ``retries`` times.
+
+
+def md5_of(path, chunk_size=1024 * 1024):
+    """Read the file in chunks and return its MD5 hash."""
+    digest = hashlib.md5()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download_part(client, part, part_directory, retries=3):
+    """Download one part unless a verified copy exists, and return its path."""
+    local_path = os.path.join(part_directory, os.path.basename(part["path"]))
+    if os.path.isfile(local_path) and md5_of(local_path) == part["md5"]:
+        return local_path, False
+    for _ in range(retries):
+        # ``download`` skips a file that it cannot find, so check that the part
+        # arrived before hashing it.
+        client.download([part["path"]], target_dir=part_directory, progress_bar=False)
+        if os.path.isfile(local_path) and md5_of(local_path) == part["md5"]:
+            return local_path, True
+    raise IOError(f"{part['path']} was not downloaded intact after {retries} attempts.")
+
+
+def download_in_parts(manifest, target_path, clients):
+    """Download the parts of a manifest and join them into ``target_path``."""
+    part_directory = target_path + ".parts"
+    os.makedirs(part_directory, exist_ok=True)
+    parts = manifest["parts"]
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        results = list(
+            executor.map(
+                lambda index: download_part(
+                    clients[index % len(clients)], parts[index], part_directory
+                ),
+                range(len(parts)),
+            )
+        )
+
+    with open(target_path, "wb") as target:
+        for local_path, _ in results:
+            with open(local_path, "rb") as part:
+                shutil.copyfileobj(part, target)
+    if md5_of(target_path) != manifest["md5"]:
+        raise IOError(f"The checksum of {target_path} does not match the manifest.")
+    return sum(downloaded for _, downloaded in results)
+
+
+# %%
+# Download the file
+# ~~~~~~~~~~~~~~~~~
+# Use two clients of the instance. The second client uses its own channel to
+# the ``ip:port`` address of the launched client, with the same maximum message
+# size. The channel is closed at the end of the example.
+
+worker_channel = grpc.insecure_channel(
+    mechanical._channel_str,
+    options=[("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH)],
+)
+clients = [mechanical, Mechanical(channel=worker_channel, cleanup_on_exit=False)]
+
+target_path = os.path.join(os.getcwd(), "downloaded_" + os.path.basename(mechdat_path))
+downloaded = download_in_parts(manifest, target_path, clients)
+print(f"Downloaded {downloaded} of {len(manifest['parts'])} parts")
+
+# %%
+# Resume an interrupted download
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Simulate an interrupted download by removing one local part and corrupting
+# another one. The second download only transfers these two parts.
+
+part_directory = target_path + ".parts"
+part_files = sorted(os.listdir(part_directory))
+os.remove(os.path.join(part_directory, part_files[0]))
+with open(os.path.join(part_directory, part_files[-1]), "r+b") as file:
+    file.write(b"corrupted")
+
+downloaded = download_in_parts(manifest, target_path, clients)
+print(f"Resumed download transferred {downloaded} of {len(manifest['parts'])} parts")
+
+# %%
+# Clean up the files
+# ~~~~~~~~~~~~~~~~~~
+# Remove the parts on the server and the local files, close the channel of the
+# second client, and clear the session.
+
+mechanical.run_python_script(f"remove_parts({json.dumps(manifest_json)})")
+shutil.rmtree(part_directory)
+os.remove(target_path)
+worker_channel.close()
+
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance. Both clients share the instance, so it is
+# closed once.
+
+mechanical.exit()
@@ -0,0 +1,175 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_12_shared_channel_pool:
+
+Share gRPC channels between clients
+-----------------------------------
+
+Each client that connects to Mechanical opens its own gRPC channel, and a client
+of a remote instance also starts a thread that keeps the session alive. An
+orchestrator that drives many instances, or several workers per instance, pays
+for these per client. This example keeps one channel per instance address in a
+pool with tuned keepalive settings, creates several clients on each pooled
+channel, and limits the number of calls that run on a channel at the same time.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
+
+from ansys.mechanical.core import Mechanical, launch_mechanical
+import grpc
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+#
+# The pooled clients connect to the ``ip:port`` address of the launched client.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+target = mechanical._channel_str
+print(f"Mechanical is listening on {target}")
+
+# %%
+# Define the channel pool
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# The pool opens one channel per ``host:port`` address the first time a client
+# for it is requested, and reuses it for every later client. The keepalive
+# options of the channel keep idle connections open through firewalls, so the
+# clients do not start their own keepalive threads. A gRPC server with default
+# settings rejects pings that come more often than every five minutes, so the
+# keepalive time defaults to five minutes.
+#
+# A semaphore per channel bounds the number of calls that run on the channel at
+# once. Each client of the pool is wrapped so that every method call, such as
+# ``run_python_script``, ``upload``, or ``download``, holds a slot of the
+# semaphore until it returns.
+
+
+class PooledClient:
+    """Client on a pooled channel that holds a slot of the channel during each call."""
+
+    def __init__(self, client, slots):
+        self._client = client
+        self._slots = slots
+
+    def __getattr__(self, name):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def call(*args, **kwargs):
+            with self._slots:
+                return attribute(*args, **kwargs)
+
+        return call
+
+
+class ChannelPool:
+    """Pool of gRPC channels shared by the clients of each instance."""
+
+    def __init__(
+        self, max_concurrent_calls=4, keepalive_time_ms=300_000, keepalive_timeout_ms=10_000
+    ):
+        self.max_concurrent_calls = max_concurrent_calls
+        self.options = [
+            ("grpc.max_receive_message_length", 256 * 1024**2),
+            ("grpc.keepalive_time_ms", keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+        ]
+        self._channels = {}
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def channel(self, target):
+        """Return the channel for ``target`` and its semaphore, opening them if needed."""
+        with self._lock:
+            if target not in self._channels:
+                self._channels[target] = grpc.insecure_channel(target, options=self.options)
+                self._slots[target] = threading.BoundedSemaphore(self.max_concurrent_calls)
+            return self._channels[target], self._slots[target]
+
+    def client(self, target):
+        """Return a new client of the instance at ``target`` on the pooled channel."""
+        channel, slots = self.channel(target)
+        with slots:
+            client = Mechanical(channel=channel, cleanup_on_exit=False, keep_connection_alive=False)
+        return PooledClient(client, slots)
+
+    def close(self):
+        """Close all channels of the pool."""
+        with self._lock:
+            for channel in self._channels.values():
+                channel.close()
+            self._channels.clear()
+            self._slots.clear()
+
+
+# %%
+# Run calls from several workers
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Create eight clients on one pooled channel. Each worker uses its own client,
+# so the clients do not wait on each other's state. All calls share one
+# channel, and at most ``max_concurrent_calls`` of them are in flight at once.
+
+n_clients = 8
+pool = ChannelPool(max_concurrent_calls=4)
+pooled_clients = [pool.client(target) for _ in range(n_clients)]
+
+
+def query(index):
+    client = pooled_clients[index % n_clients]
+    return client.run_python_script(f"str({index} * {index})")
+
+
+with ThreadPoolExecutor(max_workers=n_clients) as executor:
+    results = list(executor.map(query, range(32)))
+print(results)
+
+# %%
+# Release the channels
+# ~~~~~~~~~~~~~~~~~~~~
+# The pooled clients do not own their channel, so the pool closes it once.
+
+pool.close()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance. All clients share the instance, so it is
+# closed once.
+
+mechanical.exit()
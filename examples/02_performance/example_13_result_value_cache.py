@@ -0,0 +1,269 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_13_result_value_cache:
+
+Cache result values on the client
+---------------------------------
+
+Dashboards and reports read the same result values, such as the maximum of a
+deformation or stress result, many times per session. Each read is a script
+call. This example caches the values on the client, keyed on the result object
+and the property. Every call that reads values also returns a stamp of the
+solution on the server. When the stamp changes, the cached values are dropped,
+so later reads fetch fresh values.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import json
+import os
+import time
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+# %%
+# Open the MECHDAT file
+# ~~~~~~~~~~~~~~~~~~~~~
+# Upload the MECHDAT file to the project directory and open it.
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+mechanical.upload(file_name=mechdat_path, file_location_destination=project_directory)
+
+base_name = os.path.basename(mechdat_path)
+combined_path = os.path.join(project_directory, base_name)
+mechdat_path_modified = combined_path.replace("\\", "\\\\")
+mechanical.run_python_script(f"mechdat_path='{mechdat_path_modified}'")
+mechanical.run_python_script("ExtAPI.DataModel.Project.Open(mechdat_path)")
+
+# %%
+# Define the server functions
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# ``result_ids`` returns the object IDs of the results of an analysis by name.
+# ``solution_stamp`` returns the object state of the solution and the time and
+# size of its result file, which change with every solve or clear.
+# ``read_results`` reads one property of several results and returns the stamp
+# in the same call.
+
+mechanical.run_python_script("""
+import json
+import os
+
+def solution_stamp(analysis_index):
+    analysis = Model.Analyses[analysis_index]
+    result_file = os.path.join(analysis.WorkingDir, "file.rst")
+    if os.path.isfile(result_file):
+        modified = "%r|%d" % (os.path.getmtime(result_file), os.path.getsize(result_file))
+    else:
+        modified = "none"
+    return "%s|%s" % (analysis.Solution.ObjectState, modified)
+
+def result_ids(analysis_index):
+    solution = Model.Analyses[analysis_index].Solution
+    return json.dumps(dict((result.Name, result.ObjectId) for result in solution.Children
+                           if hasattr(result, "Maximum")))
+
+def read_results(analysis_index, object_ids, name):
+    values = {}
+    for object_id in object_ids:
+        values[str(object_id)] = str(getattr(DataModel.GetObjectById(object_id), name))
+    return json.dumps({"stamp": solution_stamp(analysis_index), "values": values})
+""")
+
+# %%
+# Define the result cache
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# The cache keys each value on the object ID and the property name, and keeps
+# the stamp of the solution the values were read from. ``read`` fetches all
+# missing values of a property in one call. When that call returns a new
+# stamp, the other cached values are dropped and fetched again. ``solve`` and
+# ``clear`` return the new stamp in the same call.
+#
+# A solution that is changed by calls that do not go through the cache keeps
+# the old values until the next miss. Pass ``check=True`` to ``read`` after such
+# calls to compare the stamp first, which costs one short call.
+
+
+class ResultCache:
+    """Client-side cache of result values of one analysis."""
+
+    def __init__(self, mechanical, analysis_index=0):
+        self._mechanical = mechanical
+        self._analysis_index = analysis_index
+        self._solution = f"Model.Analyses[{analysis_index}].Solution"
+        self._values = {}
+        self.stamp = None
+        self.hits = 0
+        self.calls = 0
+        self.ids = json.loads(self._run(f"result_ids({analysis_index})"))
+
+    def _run(self, script):
+        self.calls += 1
+        return self._mechanical.run_python_script(script)
+
+    def _update_stamp(self, stamp):
+        if stamp != self.stamp:
+            self._values.clear()
+            self.stamp = stamp
+
+    def check(self):
+        """Drop the cached values if the solution changed on the server."""
+        self._update_stamp(self._run(f"solution_stamp({self._analysis_index})"))
+
+    def read(self, names, name="Maximum", check=False):
+        """Return a property of several results, fetching only the missing values."""
+        if check:
+            self.check()
+        keys = {result: (self.ids[result], name) for result in names}
+        fetched = 0
+        while True:
+            missing = [key[0] for key in keys.values() if key not in self._values]
+            if not missing:
+                self.hits += len(keys) - fetched
+                return {result: self._values[key] for result, key in keys.items()}
+            fetched += len(missing)
+            response = json.loads(
+                self._run(f"read_results({self._analysis_index}, {missing}, '{name}')")
+            )
+            self._update_stamp(response["stamp"])
+            for object_id in missing:
+                self._values[(object_id, name)] = response["values"][str(object_id)]
+
+    def invalidate(self):
+        """Drop all cached values."""
+        self._values.clear()
+
+    def solve(self):
+        """Solve the analysis and drop the cached values."""
+        self._update_stamp(
+            self._run(f"{self._solution}.Solve(True)\nsolution_stamp({self._analysis_index})")
+        )
+
+    def clear(self):
+        """Clear the results of the analysis and drop the cached values."""
+        self._update_stamp(
+            self._run(
+                f"{self._solution}.ClearGeneratedData()\nsolution_stamp({self._analysis_index})"
+            )
+        )
+
+
+cache = ResultCache(mechanical)
+cache.solve()
+result_names = list(cache.ids)
+print(f"Results: {result_names}")
+
+# %%
+# Refresh a dashboard
+# ~~~~~~~~~~~~~~~~~~~
+# Read the minimum and maximum of every result ten times, as a dashboard that
+# refreshes does. Only the first refresh calls the server.
+
+start = time.perf_counter()
+for _ in range(10):
+    maxima = cache.read(result_names, "Maximum")
+    minima = cache.read(result_names, "Minimum")
+cached_time = time.perf_counter() - start
+
+for result in result_names:
+    print(f"{result}: {minima[result]} to {maxima[result]}")
+print(f"{cache.calls} script calls and {cache.hits} cache hits in {cached_time:.3f} s")
+
+# %%
+# Compare with uncached reads
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Read the same values with one script call per value and refresh.
+
+start = time.perf_counter()
+for _ in range(10):
+    for result in result_names:
+        for name in ["Maximum", "Minimum"]:
+            mechanical.run_python_script(
+                f"str(DataModel.GetObjectById({cache.ids[result]}).{name})"
+            )
+uncached_time = time.perf_counter() - start
+print(f"{10 * 2 * len(result_names)} script calls in {uncached_time:.3f} s")
+
+# %%
+# Solve again
+# ~~~~~~~~~~~
+# Solving through the cache returns a new stamp, so the next read fetches the
+# values again.
+
+calls_before = cache.calls
+cache.solve()
+maxima = cache.read(result_names, "Maximum")
+print(f"Maxima after the new solve: {maxima}")
+print(f"{cache.calls - calls_before} script calls for the solve and the read")
+
+# %%
+# Detect changes made outside the cache
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Clear and solve the analysis with direct script calls. A read with
+# ``check=True`` sees the new stamp and fetches the values again.
+
+mechanical.run_python_script("""
+Model.Analyses[0].Solution.ClearGeneratedData()
+Model.Analyses[0].Solution.Solve(True)
+""")
+calls_before = cache.calls
+maxima = cache.read(result_names, "Maximum", check=True)
+print(f"Maxima after the direct solve: {maxima}")
+print(f"{cache.calls - calls_before} script calls for the check and the read")
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project.
+
+mechanical.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
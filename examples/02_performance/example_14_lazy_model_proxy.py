@@ -0,0 +1,324 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""".. _ref_example_14_lazy_model_proxy:
+
+Browse the data model with lazy proxies
+---------------------------------------
+
+Every interaction with ``Model`` and its objects is usually written as a script
+string and returns a string. This example defines proxy objects on the client
+that mirror data model objects. A proxy reads properties and children when they
+are first used, reads several properties of several objects in one call, and keeps
+the values until the model is changed through the session.
+
+"""
+
+# %%
+# Import necessary libraries
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import json
+import os
+
+from ansys.mechanical.core import launch_mechanical
+from ansys.mechanical.core.examples import download_file
+
+# %%
+# Download required files
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Download the MECHDAT file of a simple bolt model.
+
+mechdat_path = download_file("example_03_simple_bolt_new.mechdat", "pymechanical", "00_basic")
+print(f"Downloaded the MECHDAT file to: {mechdat_path}")
+
+# %%
+# Launch mechanical
+# ~~~~~~~~~~~~~~~~~
+# Launch a new Mechanical session in batch, setting the ``cleanup_on_exit``
+# argument to ``False``. To close this Mechanical session when finished,
+# this example must call  the ``mechanical.exit()`` method.
+
+mechanical = launch_mechanical(batch=True, cleanup_on_exit=False)
+print(mechanical)
+
+# %%
+# Open the MECHDAT file
+# ~~~~~~~~~~~~~~~~~~~~~
+# Upload the MECHDAT file to the project directory and open it.
+
+project_directory = mechanical.project_directory
+print(f"project directory = {project_directory}")
+
+mechanical.upload(file_name=mechdat_path, file_location_destination=project_directory)
+
+base_name = os.path.basename(mechdat_path)
+combined_path = os.path.join(project_directory, base_name)
+mechdat_path_modified = combined_path.replace("\\", "\\\\")
+mechanical.run_python_script(f"mechdat_path='{mechdat_path_modified}'")
+mechanical.run_python_script("ExtAPI.DataModel.Project.Open(mechdat_path)")
+
+# %%
+# Define the server functions
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# ``read_attributes`` evaluates several object expressions and reads the same
+# properties of each object. Values that are data model objects are returned as
+# object IDs, enumeration values as their type and member names, and quantities
+# as their value and unit. Other values that JSON cannot hold are returned as
+# strings. ``read_children`` returns the object IDs of the children of an object.
+
+mechanical.run_python_script("""
+import json
+import System
+
+def encode(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"value": value}
+    if hasattr(value, "ObjectId"):
+        return {"object": value.ObjectId}
+    if isinstance(value, System.Enum):
+        return {"enum": [value.GetType().FullName.replace("+", "."), str(value)]}
+    if hasattr(value, "Value") and hasattr(value, "Unit"):
+        return {"quantity": [value.Value, value.Unit]}
+    return {"value": str(value)}
+
+def read_attributes(expressions, names):
+    values = []
+    for expression in expressions:
+        target = eval(expression)
+        values.append(dict((name, encode(getattr(target, name))) for name in names))
+    return json.dumps(values)
+
+def read_children(expression):
+    return json.dumps([child.ObjectId for child in eval(expression).Children])
+""")
+
+# %%
+# Define the proxies
+# ~~~~~~~~~~~~~~~~~~
+# A ``ModelProxy`` object holds the script expression of a data model object.
+# Reading an attribute fetches it the first time and caches it. ``fetch`` and
+# ``ModelSession.prefetch`` read several properties, of one or several objects,
+# in one call. Enumeration values and quantities are read as ``ScriptValue``
+# objects, which print like the value and are sent back as a script expression.
+#
+# Setting an attribute sends the assignment. A proxy is sent as its expression,
+# a ``ScriptValue`` as its expression, and numbers, strings, and booleans as
+# literals. Other values raise a ``TypeError``. Use ``ScriptValue`` to assign
+# any other expression, such as ``ScriptValue('Quantity(5, "mm")')``.
+#
+# Setting an attribute, ``ModelSession.run``, and ``ModelSession.clear``
+# increase the generation of the session, which drops the cached values of
+# every proxy, because one change can affect other properties. Calls made on
+# the Mechanical client directly bypass the session. Call
+# ``ModelSession.invalidate`` after them. Proxies created from object IDs refer
+# to other objects or to none after ``clear``, so get new proxies from
+# ``ModelSession.root`` afterwards.
+
+
+class ScriptValue:
+    """Value that is sent to the server as a script expression."""
+
+    def __init__(self, expression, text=None):
+        self.expression = expression
+        self.text = expression if text is None else text
+
+    def __repr__(self):
+        return self.text
+
+
+class ModelSession:
+    """Entry point for proxies of the data model of a Mechanical session."""
+
+    def __init__(self, mechanical):
+        self._mechanical = mechanical
+        self.generation = 0
+        self.calls = 0
+
+    def _run(self, script):
+        self.calls += 1
+        return self._mechanical.run_python_script(script)
+
+    def run(self, script):
+        """Run a script that can change the model and drop the cached values."""
+        self.invalidate()
+        return self._run(script)
+
+    def invalidate(self):
+        """Drop the cached values of every proxy of the session."""
+        self.generation += 1
+
+    def clear(self):
+        """Clear the Mechanical session and drop the cached values."""
+        self._mechanical.clear()
+        self.invalidate()
+
+    def root(self, expression):
+        """Return the proxy of the object that a script expression evaluates to."""
+        return ModelProxy(self, expression)
+
+    def object(self, object_id):
+        """Return the proxy of the object with an object ID."""
+        return ModelProxy(self, f"DataModel.GetObjectById({object_id})")
+
+    def decode(self, encoded):
+        if "object" in encoded:
+            return self.object(encoded["object"])
+        if "enum" in encoded:
+            enum_type, member = encoded["enum"]
+            return ScriptValue(f"{enum_type}.{member}", member)
+        if "quantity" in encoded:
+            value, unit = encoded["quantity"]
+            return ScriptValue(f"Quantity({value!r}, {unit!r})", f"{value} [{unit}]")
+        return encoded["value"]
+
+    def encode(self, value):
+        """Return the script expression of a value to assign."""
+        if isinstance(value, ModelProxy):
+            return value._expression
+        if isinstance(value, ScriptValue):
+            return value.expression
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return repr(value)
+        raise TypeError(f"Cannot assign {value!r}. Wrap its script expression in a ScriptValue.")
+
+    def prefetch(self, proxies, *names):
+        """Read properties of several proxies in one call."""
+        pending = [proxy for proxy in proxies if proxy._missing(names)]
+        if not pending:
+            return
+        expressions = [proxy._expression for proxy in pending]
+        values = json.loads(self._run(f"read_attributes({expressions}, {list(names)})"))
+        for proxy, proxy_values in zip(pending, values):
+            for name, encoded in proxy_values.items():
+                proxy._cache[name] = self.decode(encoded)
+
+
+class ModelProxy:
+    """Lazy client-side proxy of a data model object."""
+
+    def __init__(self, session, expression):
+        object.__setattr__(self, "_session", session)
+        object.__setattr__(self, "_expression", expression)
+        object.__setattr__(self, "_cache", {})
+        object.__setattr__(self, "_children", None)
+        object.__setattr__(self, "_generation", session.generation)
+
+    def _missing(self, names):
+        if self._generation != self._session.generation:
+            self._cache.clear()
+            object.__setattr__(self, "_children", None)
+            object.__setattr__(self, "_generation", self._session.generation)
+        return [name for name in names if name not in self._cache]
+
+    def fetch(self, *names):
+        """Return several properties, reading the missing ones in one call."""
+        self._session.prefetch([self], *names)
+        return [self._cache[name] for name in names]
+
+    def children(self):
+        """Return the proxies of the children, reading their IDs the first time."""
+        self._missing([])
+        if self._children is None:
+            ids = json.loads(self._session._run(f"read_children({self._expression!r})"))
+            object.__setattr__(
+                self,
+                "_children",
+                [self._session.object(object_id) for object_id in ids],
+            )
+        return self._children
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.fetch(name)[0]
+
+    def __setattr__(self, name, value):
+        self._session.run(f"{self._expression}.{name} = {self._session.encode(value)}")
+
+    def __repr__(self):
+        return f"ModelProxy({self._expression})"
+
+
+session = ModelSession(mechanical)
+
+# %%
+# Browse the analysis
+# ~~~~~~~~~~~~~~~~~~~
+# Reading ``Name`` calls the server. Reading it again uses the cached value.
+
+analysis = session.root("Model.Analyses[0]")
+print(f"Analysis: {analysis.Name}, {analysis.AnalysisType}")
+print(f"Analysis again: {analysis.Name}")
+print(f"{session.calls} script calls")
+
+# %%
+# Read the tree in few calls
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Read the children of the analysis and of its solution, then read the name
+# and state of all of them in one call. The ``Solution`` property is returned
+# as a proxy.
+
+calls_before = session.calls
+solution = analysis.Solution
+objects = analysis.children() + solution.children()
+session.prefetch(objects, "Name", "ObjectState")
+for child in objects:
+    print(f"{child.Name}: {child.ObjectState}")
+print(f"{session.calls - calls_before} script calls for {len(objects)} objects")
+
+# %%
+# Set properties
+# ~~~~~~~~~~~~~~
+# Setting ``Name`` sends the assignment. The next read fetches the new value.
+# The element size of the mesh is a quantity. It is read as a ``ScriptValue``,
+# and a new size is assigned as a ``Quantity`` expression. The solver type of
+# the analysis settings is an enumeration value, which is assigned back as it
+# was read.
+
+analysis.Name = "Bolt analysis"
+print(f"Renamed analysis: {analysis.Name}")
+
+mesh = session.root("Model.Mesh")
+print(f"Element size: {mesh.ElementSize}")
+mesh.ElementSize = ScriptValue('Quantity(5, "mm")')
+print(f"New element size: {mesh.ElementSize}")
+
+analysis_settings = session.root("Model.Analyses[0].AnalysisSettings")
+solver_type = analysis_settings.SolverType
+analysis_settings.SolverType = solver_type
+print(f"Solver type: {analysis_settings.SolverType}")
+
+# %%
+# Clear the data
+# ~~~~~~~~~~~~~~
+# Clear the data so it isn't saved to the project. Clearing through the session
+# drops the cached values of the proxies.
+
+session.clear()
+
+# %%
+# Close mechanical
+# ~~~~~~~~~~~~~~~~
+# Close the mechanical instance.
+
+mechanical.exit()
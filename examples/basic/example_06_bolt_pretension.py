@@ -36,12 +36,16 @@ equivalent stresses, contact, and bolt
 # Import necessary libraries
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+import hashlib
+import json
 import os
 
+from ansys.mapdl import reader as pymapdl_reader
 from ansys.mechanical.core import launch_mechanical
 from ansys.mechanical.core.examples import download_file
 from matplotlib import image as mpimg
 from matplotlib import pyplot as plt
+import numpy as np
 
 # %%
 # Launch mechanical
@@ -128,9 +132,24 @@ print(f"mat_Steel_file_path on server: {result}")
 # analysis
 
 output = mechanical.run_python_script("""
+import hashlib
 import json
 import os
 
+# Record a file produced by this script so the client can download it
+# without guessing its path.
+artifacts = []
+def register_artifact(path, kind):
+    digest = hashlib.md5()
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+    artifacts.append({"path": path, "kind": kind,
+                      "size": os.path.getsize(path), "md5": digest.hexdigest()})
+
 # Read geometry and material information.
 geometry_import_group = Model.GeometryImportGroup
 geometry_import = geometry_import_group.AddGeometryImport()
@@ -240,68 +259,48 @@ for connection in connections.Children:
     if connection.DataModelObjectCategory==DataModelObjectCategory.ConnectionGroup:
         connection.Delete()
 
-CONT_REG1 = CONN_GRP.AddContactRegion()
-CONT_REG1.SourceLocation = NS_GRP.Children[0]
-CONT_REG1.TargetLocation = NS_GRP.Children[1]
-CONT_REG1.ContactType=ContactType.Frictional
-CONT_REG1.FrictionCoefficient = 0.2
-CONT_REG1.SmallSliding = ContactSmallSlidingType.Off
-CONT_REG1.UpdateStiffness = UpdateContactStiffness.Never
-CMD1=CONT_REG1.AddCommandSnippet()
+# Define the contact regions as a table. Each row holds the indices of the
+# source and target named selections, the contact type, the friction
+# coefficient, and the contact formulation.
+CONTACT_TABLE = [
+    (0, 1, ContactType.Frictional, 0.2, None),
+    (3, 2, ContactType.Bonded, None, ContactFormulation.MPC),
+    (4, 5, ContactType.Frictional, 0.2, None),
+    (6, 7, ContactType.Bonded, None, ContactFormulation.MPC),
+    (9, 8, ContactType.Bonded, None, ContactFormulation.MPC),
+    (10, 11, ContactType.Frictional, 0.2, None),
+]
 
 # Add missing contact keyopt and Archard Wear Model in workbench using a command snippet.
+# All frictional contact regions share the same snippet text.
 AWM = '''keyopt,cid,9,5
 rmodif,cid,10,0.00
 rmodif,cid,23,0.001'''
-CMD1.AppendText(AWM)
-
-CONTS = CONN_GRP.Children[0]
-CONT_REG2 = CONTS.AddContactRegion()
-CONT_REG2.SourceLocation = NS_GRP.Children[3]
-CONT_REG2.TargetLocation = NS_GRP.Children[2]
-CONT_REG2.ContactType=ContactType.Bonded
-CONT_REG2.ContactFormulation = ContactFormulation.MPC
-
-CONT_REG3 = CONTS.AddContactRegion()
-CONT_REG3.SourceLocation = NS_GRP.Children[4]
-CONT_REG3.TargetLocation = NS_GRP.Children[5]
-CONT_REG3.ContactType=ContactType.Frictional
-CONT_REG3.FrictionCoefficient = 0.2
-CONT_REG3.SmallSliding = ContactSmallSlidingType.Off
-CONT_REG3.UpdateStiffness = UpdateContactStiffness.Never
-CMD3=CONT_REG3.AddCommandSnippet()
 
-# Add missing contact keyopt and Archard Wear Model in workbench using a command snippet.
-AWM3 = '''keyopt,cid,9,5
-rmodif,cid,10,0.00
-rmodif,cid,23,0.001'''
-CMD3.AppendText(AWM3)
-
-CONT_REG4 = CONTS.AddContactRegion()
-CONT_REG4.SourceLocation = NS_GRP.Children[6]
-CONT_REG4.TargetLocation = NS_GRP.Children[7]
-CONT_REG4.ContactType=ContactType.Bonded
-CONT_REG4.ContactFormulation = ContactFormulation.MPC
-
-CONT_REG5 = CONTS.AddContactRegion()
-CONT_REG5.SourceLocation = NS_GRP.Children[9]
-CONT_REG5.TargetLocation = NS_GRP.Children[8]
-CONT_REG5.ContactType=ContactType.Bonded
-CONT_REG5.ContactFormulation = ContactFormulation.MPC
-
-CONT_REG6 = CONTS.AddContactRegion()
-CONT_REG6.SourceLocation = NS_GRP.Children[10]
-CONT_REG6.TargetLocation = NS_GRP.Children[11]
-CONT_REG6.ContactType=ContactType.Frictional
-CONT_REG6.FrictionCoefficient = 0.2
-CONT_REG6.SmallSliding = ContactSmallSlidingType.Off
-CONT_REG6.UpdateStiffness = UpdateContactStiffness.Never
-CMD6=CONT_REG6.AddCommandSnippet()
-# Add missing contact keyopt and Archard Wear Model in workbench using a command snippet.
-AWM6 = '''keyopt,cid,9,5
-rmodif,cid,10,0.00
-rmodif,cid,23,0.001'''
-CMD6.AppendText(AWM6)
+# Create all contact regions in one transaction so the tree updates once.
+def add_contact_regions(contact_table):
+    contact_regions = []
+    with Transaction():
+        for source, target, contact_type, friction, formulation in contact_table:
+            if contact_regions:
+                contact_region = CONN_GRP.Children[0].AddContactRegion()
+            else:
+                contact_region = CONN_GRP.AddContactRegion()
+            contact_region.SourceLocation = NS_GRP.Children[source]
+            contact_region.TargetLocation = NS_GRP.Children[target]
+            contact_region.ContactType = contact_type
+            if formulation is not None:
+                contact_region.ContactFormulation = formulation
+            if contact_type == ContactType.Frictional:
+                contact_region.FrictionCoefficient = friction
+                contact_region.SmallSliding = ContactSmallSlidingType.Off
+                contact_region.UpdateStiffness = UpdateContactStiffness.Never
+                contact_region.AddCommandSnippet().AppendText(AWM)
+            contact_regions.append(contact_region)
+    return contact_regions
+
+CONT_REG1, CONT_REG2, CONT_REG3, CONT_REG4, CONT_REG5, CONT_REG6 = \
+    add_contact_regions(CONTACT_TABLE)
 
 # Add contact tool.
 #CONT_TOOL = CONN_GRP.AddContactTool()
@@ -408,39 +407,70 @@ export_path = os.path.join(mechdir, "contact_status.png")
 Post_Contact_Tool.Children[0].Activate()
 Graphics.ExportImage(export_path, GraphicsImageExportFormat.PNG)
 
+register_artifact(export_path, "contact_status")
+register_artifact(os.path.join(mechdir, "solve.out"), "solve_out")
+register_artifact(os.path.join(mechdir, "file.rst"), "result")
+
 my_results_details = {
     "Total_Deformation": str(Total_Deformation.Maximum),
     "Equivalent_Stress1": str(Equivalent_stress_1.Maximum),
     "Equivalent_Stress2": str(Equivalent_stress_2.Maximum),
 }
 
-json.dumps(my_results_details)
+json.dumps({"results": my_results_details, "artifacts": artifacts})
 """)
-print(output)
+output = json.loads(output)
+print(output["results"])
 
 # %%
-# Initialize the variable needed for the image directory
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# Set the ``image_dir`` variable for later use.
-# Make the variable compatible for Windows, Linux, and Docker containers.
-
-# image_directory_modified = project_directory.replace("\\", "\\\\")
-mechanical.run_python_script(f"image_dir=ExtAPI.DataModel.AnalysisList[0].WorkingDir")
-
-
-# Verify the path for image directory.
-result_image_dir_server = mechanical.run_python_script(f"image_dir")
-print(f"Images are stored on the server at: {result_image_dir_server}")
+# Download the artifacts
+# ~~~~~~~~~~~~~~~~~~~~~~
+# The script returns a manifest of the files it produced with their kind,
+# size, and MD5 checksum. ``download_artifacts`` works with the manifest of any
+# script that records its files with ``register_artifact``. It downloads
+# exactly these files in one call, matches the downloaded files to the
+# manifest by file name, and verifies them. ``download`` skips files that it
+# cannot find, so a missing file raises an error that names it.
+
+
+def verify_artifact(artifact, local_path):
+    """Check the size and checksum of a downloaded artifact."""
+    digest = hashlib.md5()
+    with open(local_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    md5 = digest.hexdigest()
+    if os.path.getsize(local_path) != artifact["size"] or md5 != artifact["md5"]:
+        raise IOError(f"{local_path} does not match the artifact manifest.")
+
+
+def download_artifacts(client, artifacts, target_dir):
+    """Download and verify the files of an artifact manifest and return their paths by kind."""
+    names = [os.path.basename(artifact["path"]) for artifact in artifacts]
+    if len(set(names)) != len(names):
+        raise ValueError("The artifacts must have different file names to share a directory.")
+    server_paths = [artifact["path"] for artifact in artifacts]
+    downloaded = client.download(server_paths, target_dir=target_dir)
+    local_paths = {os.path.basename(local_path): local_path for local_path in downloaded}
+
+    artifact_paths = {}
+    for artifact, name in zip(artifacts, names):
+        if name not in local_paths:
+            raise FileNotFoundError(f"The artifact {artifact['path']} was not downloaded.")
+        verify_artifact(artifact, local_paths[name])
+        artifact_paths[artifact["kind"]] = local_paths[name]
+    return artifact_paths
+
+
+artifacts = output["artifacts"]
+artifact_paths = download_artifacts(mechanical, artifacts, os.getcwd())
+for artifact in artifacts:
+    print(f"{artifact['kind']}: {artifact_paths[artifact['kind']]} ({artifact['size']} bytes)")
 
 # %%
-# Download the image and plot
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# Download one image file from the server to the current working directory and plot
-# using matplotlib.
-
-
-def get_image_path(image_name):
-    return os.path.join(result_image_dir_server, image_name)
+# Plot the image
+# ~~~~~~~~~~~~~~
+# Plot the contact status image using matplotlib.
 
 
 def display_image(path):
@@ -452,36 +482,12 @@ def display_image(path):
     plt.show()
 
 
-image_name = "contact_status.png"
-image_path_server = get_image_path(image_name)
-
-if image_path_server != "":
-    current_working_directory = os.getcwd()
-
-    local_file_path_list = mechanical.download(
-        image_path_server, target_dir=current_working_directory
-    )
-    image_local_path = local_file_path_list[0]
-    print(f"Local image path : {image_local_path}")
-
-    display_image(image_local_path)
+display_image(artifact_paths["contact_status"])
 
 # %%
-# Download output file from solve and print contents
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# Download the ``solve.out`` file from the server to the current working
-# directory and print the contents. Remove the ``solve.out`` file.
-
-
-def get_solve_out_path(mechanical):
-    """Get the solve out path and return."""
-    solve_out_path = ""
-    for file_path in mechanical.list_files():
-        if file_path.find("solve.out") != -1:
-            solve_out_path = file_path
-            break
-
-    return solve_out_path
+# Print the output file from solve
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Print the contents of the ``solve.out`` file. Remove the ``solve.out`` file.
 
 
 def write_file_contents_to_console(path):
@@ -491,21 +497,43 @@ def write_file_contents_to_console(path):
             print(line, end="")
 
 
-solve_out_path = get_solve_out_path(mechanical)
-
-if solve_out_path != "":
-    current_working_directory = os.getcwd()
+write_file_contents_to_console(artifact_paths["solve_out"])
 
-    mechanical.download(solve_out_path, target_dir=current_working_directory)
-    solve_out_local_path = os.path.join(current_working_directory, "solve.out")
+os.remove(artifact_paths["solve_out"])
 
-    write_file_contents_to_console(solve_out_local_path)
-
-    os.remove(solve_out_local_path)
+result_file_local_path = artifact_paths["result"]
 
 # %%
 # Close mechanical
 # ~~~~~~~~~~~~~~~~
-# Close the mechanical instance.
+# Close the mechanical instance. The result file is post-processed locally,
+# so the session and its license are released first.
 
 mechanical.exit()
+
+# %%
+# Read the result file locally
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Open the result file with ``ansys-mapdl-reader``. Opening the file only reads
+# its header and the mesh. The nodal displacements of each result set are read
+# from the file when they are requested, so large transient result files do not
+# have to fit in memory at once.
+
+result = pymapdl_reader.read_binary(result_file_local_path)
+print(result)
+
+time_values = result.time_values
+max_displacement = np.zeros(result.nsets)
+for index in range(result.nsets):
+    node_numbers, displacement = result.nodal_displacement(index)
+    max_displacement[index] = np.linalg.norm(displacement[:, :3], axis=1).max()
+    print(f"time {time_values[index]:6.3f} s: maximum displacement {max_displacement[index]:.4e}")
+
+plt.figure(figsize=(8, 5))
+plt.plot(time_values, max_displacement, marker="o")
+plt.xlabel("Time [s]")
+plt.ylabel("Maximum displacement [mm]")
+plt.title("Maximum displacement per result set")
+plt.show()
+
+os.remove(result_file_local_path)
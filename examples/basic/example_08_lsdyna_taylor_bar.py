@@ -35,6 +35,7 @@ and plastic strain (EPS) animation is exported in the project directory.
 # Download required files
 # ~~~~~~~~~~~~~~~~~~~~~~~
 # Download the required files. Print the file path for the geometry file.
+import json
 import os
 
 from PIL import Image
@@ -171,14 +172,14 @@ mesh.ElementSize = Quantity(0.5, "mm")
 analysis.Solution.Solve()
 
 # Post-processing
+# Add both result objects first, and then evaluate them with one call.
 
 eps = analysis.Solution.AddUserDefinedResult()
 eps.Expression = "EPS"
-eps.EvaluateAllResults()
+total_deformation = analysis.Solution.AddTotalDeformation()
+analysis.Solution.EvaluateAllResults()
 eps_max = eps.Maximum
 eps_min = eps.Minimum
-total_deformation = analysis.Solution.AddTotalDeformation()
-total_deformation.EvaluateAllResults()
 
 # Set Camera
 
@@ -245,6 +246,66 @@ mechanical.run_python_script(f"image_dir=ExtAPI.DataModel.AnalysisList[0].Workin
 result_image_dir_server = mechanical.run_python_script(f"image_dir")
 print(f"Images are stored on the server at: {result_image_dir_server}")
 
+# %%
+# Evaluate a batch of result definitions
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Describe each result by its type, an optional expression, an optional named
+# selection to scope it to, and an optional display time in seconds. The
+# ``evaluate_results`` function adds all the results in one transaction,
+# evaluates them with a single ``EvaluateAllResults`` call, and returns their
+# minimum and maximum values in one script call.
+
+mechanical.run_python_script("""
+import json
+
+bar = Model.AddNamedSelection()
+bar.Name = "bar"
+selection = ExtAPI.SelectionManager.CreateSelectionInfo(SelectionTypeEnum.GeometryEntities)
+selection.Ids = [ExtAPI.DataModel.GeoData.Assemblies[0].Parts[0].Bodies[0].Id]
+bar.Location = selection
+
+def evaluate_results(definitions):
+    solution = Model.Analyses[0].Solution
+    named_selections = dict((ns.Name, ns) for ns in Model.NamedSelections.Children)
+    results = []
+    with Transaction():
+        for definition in definitions:
+            result = getattr(solution, "Add" + definition["type"])()
+            result.Name = definition["name"]
+            if "expression" in definition:
+                result.Expression = definition["expression"]
+            if "scoping" in definition:
+                result.Location = named_selections[definition["scoping"]]
+            if "display_time" in definition:
+                result.DisplayTime = Quantity(definition["display_time"], "s")
+            results.append(result)
+    solution.EvaluateAllResults()
+    return json.dumps(dict(
+        (result.Name, {"minimum": str(result.Minimum), "maximum": str(result.Maximum)})
+        for result in results))
+""")
+
+result_definitions = [
+    {
+        "name": f"EPS at {time:g} s",
+        "type": "UserDefinedResult",
+        "expression": "EPS",
+        "display_time": time,
+    }
+    for time in (1.0e-5, 2.0e-5, 3.0e-5)
+]
+result_definitions.append(
+    {
+        "name": "Bar deformation",
+        "type": "TotalDeformation",
+        "scoping": "bar",
+        "display_time": 3.0e-5,
+    }
+)
+output = mechanical.run_python_script(f"evaluate_results({json.dumps(result_definitions)})")
+for name, values in json.loads(output).items():
+    print(f"{name:<20} minimum {values['minimum']:<25} maximum {values['maximum']}")
+
 # %%
 # Download output file from solve and print contents
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
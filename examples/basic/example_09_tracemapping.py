@@ -35,7 +35,10 @@ Python scripting commands to mesh the model and export an image.
 # Import necessary libraries
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+import hashlib
+import json
 import os
+import tempfile
 
 from ansys.mechanical.core import launch_mechanical
 from ansys.mechanical.core.examples import download_file
@@ -68,13 +71,145 @@ all_input_files = {
 project_directory = mechanical.project_directory
 print(f"project directory = {project_directory}")
 
+# %%
+# Check the trace file before the transfer
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Production ECAD trace files can be hundreds of MB. Read the file once in
+# fixed-size chunks, without loading it into memory, to check that it is
+# readable and not empty and to compute its content hash. This check does not
+# parse the trace format. Mechanical reads the layers and vias when it imports
+# the file, and the script reports their counts after the import.
+
+
+def scan_trace_file(path, chunk_size=1024 * 1024):
+    """Read the file in chunks and return its size in bytes and SHA-256 hash."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    if size == 0:
+        raise ValueError(f"The trace file {path} is empty.")
+    return size, digest.hexdigest()
+
+
+# %%
+# Define the upload in parts
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define functions in the session that return the MD5 checksum of each part
+# that is already on the server and join the parts into one file. The client
+# splits the trace file into parts, uploads only the parts that are missing on
+# the server or differ from the local ones, and reports the progress through a
+# callback. When an upload is interrupted, the next call resumes from the parts
+# that arrived intact. The parts are removed once they are joined.
+
+mechanical.run_python_script("""
+import hashlib
+import json
+import os
+
+def md5_of(path):
+    digest = hashlib.md5()
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def part_digests(paths):
+    return json.dumps([md5_of(path) if os.path.isfile(path) else None for path in paths])
+
+def join_parts(paths, target):
+    digest = hashlib.sha256()
+    with open(target, "wb") as output:
+        for path in paths:
+            with open(path, "rb") as part:
+                while True:
+                    chunk = part.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    output.write(chunk)
+    for path in paths:
+        os.remove(path)
+    return digest.hexdigest()
+""")
+
+
+def upload_in_parts(client, path, target_directory, progress=None, part_size=16 * 1024 * 1024):
+    """Upload a file in parts, skipping the parts already on the server, and join them there.
+
+    ``progress`` is called with the number of bytes on the server and the size
+    of the file after each part. Return the SHA-256 hash of the joined file.
+    """
+    size = os.path.getsize(path)
+    base_name = os.path.basename(path)
+    with tempfile.TemporaryDirectory() as part_directory:
+        parts = []
+        with open(path, "rb") as source:
+            for data in iter(lambda: source.read(part_size), b""):
+                part_path = os.path.join(part_directory, f"{base_name}.part{len(parts):04d}")
+                with open(part_path, "wb") as part:
+                    part.write(data)
+                parts.append((part_path, len(data), hashlib.md5(data).hexdigest()))
+
+        server_paths = [
+            os.path.join(target_directory, os.path.basename(part_path)) for part_path, _, _ in parts
+        ]
+        digests_script = f"part_digests({json.dumps(server_paths)})"
+        on_server = json.loads(client.run_python_script(digests_script))
+        done = 0
+        for (part_path, part_bytes, md5), server_md5 in zip(parts, on_server):
+            if server_md5 != md5:
+                client.upload(
+                    file_name=part_path,
+                    file_location_destination=target_directory,
+                    progress_bar=False,
+                )
+            done += part_bytes
+            if progress is not None:
+                progress(done, size)
+
+        on_server = json.loads(client.run_python_script(digests_script))
+        damaged = [
+            os.path.basename(part_path)
+            for (part_path, _, md5), server_md5 in zip(parts, on_server)
+            if server_md5 != md5
+        ]
+        if damaged:
+            raise IOError(f"Parts {damaged} did not arrive intact. Upload the file again.")
+
+    target = os.path.join(target_directory, base_name)
+    return client.run_python_script(f"join_parts({json.dumps(server_paths)}, {json.dumps(target)})")
+
+
+def print_progress(done, total):
+    print(f"Uploaded {done} of {total} bytes ({100 * done / total:.0f}%)")
+
+
+# %%
+# Upload the input files
+# ~~~~~~~~~~~~~~~~~~~~~~
+# Upload the trace file in parts and check the hash of the joined file against
+# the local one. Upload the other files with the default settings.
+
 for file_type, file_name in all_input_files.items():
     file_path = download_file(file_name, "pymechanical", "00_basic")
 
     print(f"Downloaded the {file_type} to: {file_path}")
 
     # Upload the file to the project directory.
-    mechanical.upload(file_name=file_path, file_location_destination=project_directory)
+    if file_type == "def_file":
+        def_size, def_hash = scan_trace_file(file_path)
+        print(f"Trace file: {def_size} bytes, SHA-256 {def_hash}")
+        joined_hash = upload_in_parts(mechanical, file_path, project_directory, print_progress)
+        if joined_hash != def_hash:
+            raise IOError(f"The trace file on the server does not match {file_path}.")
+    else:
+        mechanical.upload(file_name=file_path, file_location_destination=project_directory)
 
     # Build the path relative to project directory.
     base_name = os.path.basename(file_path)
@@ -87,6 +222,7 @@ for file_type, file_name in all_input_files.items():
 
 png_image_name = "myplot.png"
 mechanical.run_python_script(f"image_name='{png_image_name}'")
+mechanical.run_python_script(f"def_hash='{def_hash}'")
 
 # %%
 # Run the script
@@ -95,6 +231,7 @@ mechanical.run_python_script(f"image_name='{png_image_name}'")
 # analysis.
 
 output = mechanical.run_python_script("""
+import hashlib
 import os
 
 
@@ -128,48 +265,39 @@ materials.Import(copper_alloy_material_file)
 materials.Import(fr4_material_file)
 
 
-# create lists of body ids to create named selections later
+# Classify the bodies with a list of rules. Each rule holds a predicate on the
+# body name, the name of the named selection to create, and the material to
+# assign. The first matching rule applies. All bodies are visited once, and the
+# materials and named selections are created in one transaction.
 
-board_bodyids = []
-component_bodyids = []
-geo = ExtAPI.DataModel.GeoData
-mesh = ExtAPI.DataModel.Project.Model.Mesh
-for asm in geo.Assemblies:
-    for part in asm.Parts:
-        for body in part.Bodies:
-            if body.Name[:9] != "Component":
-                board_bodyids.append(body.Id)
-            else:
-                component_bodyids.append(body.Id)
+body_rules = [
+    (lambda name: name.startswith("Component"), "components", "Copper Alloy"),
+    (lambda name: True, "board_layers", "FR-4"),
+]
 
-# Assign  Materials based on Body Names
 
-parts = ExtAPI.DataModel.Project.Model.Geometry.Children  # list of parts
-for part in parts:
-    for body in part.Children:
-        body.Material = "Copper Alloy" if body.Name[:9] == "Component" else "FR-4"
+def classify_bodies(rules):
+    body_ids = {ns_name: [] for _, ns_name, _ in rules}
+    with Transaction():
+        for body in Model.Geometry.GetChildren(DataModelObjectCategory.Body, True):
+            for predicate, ns_name, material in rules:
+                if predicate(body.Name):
+                    body.Material = material
+                    body_ids[ns_name].append(body.GetGeoBody().Id)
+                    break
 
+        for _, ns_name, _ in rules:
+            selection = ExtAPI.SelectionManager.CreateSelectionInfo(
+                SelectionTypeEnum.GeometryEntities
+            )
+            selection.Ids = body_ids[ns_name]
+            named_sel = Model.AddNamedSelection()
+            named_sel.Name = ns_name
+            named_sel.Location = selection
+    return body_ids
 
-# Function to create named selection from list of body ids
 
-def create_named_selection_from_id_list(ns_name, list_of_body_ids):
-
-    selection_manager = ExtAPI.SelectionManager
-    selection = ExtAPI.SelectionManager.CreateSelectionInfo(
-        SelectionTypeEnum.GeometryEntities
-    )
-    selection.Ids = list_of_body_ids
-    selection_manager.NewSelection(selection)
-
-    model = ExtAPI.DataModel.Project.Model
-    named_sel = model.AddNamedSelection()
-    named_sel.Name = ns_name
-    named_sel.Location = selection
-    selection_manager.ClearSelection()
-
-
-create_named_selection_from_id_list("board_layers", board_bodyids)
-create_named_selection_from_id_list("components", component_bodyids)
+board_bodyids = classify_bodies(body_rules)["board_layers"]
 
 # make a selection to be used with mesh methods
 
@@ -194,52 +322,94 @@ mesh.GenerateMesh()
 
 
 # Defining External Data Object  for Importing Trace
+# The mapped traces are cached in the session, keyed on the hash of the trace
+# file, a fingerprint of the mesh, and the import settings. The fingerprint
+# hashes the mesh sizing settings, the swept bodies, the node and element
+# counts, and the mesh state, which are cheap to read. When a later variant
+# only changes materials, the mapping step is skipped. Session variables
+# survive ``clear()`` and new projects, so a cached entry is only used when it
+# still refers to an imported trace of the current model.
+
+if "trace_cache" not in globals():
+    trace_cache = {}
+
+
+def mesh_fingerprint():
+    text = "%s|%s|%s|%s|%d|%d|%s" % (
+        mesh.ElementSize, mesh_sizing.ElementSize, mesh_method.SweepNumberDivisions,
+        sorted(mesh_method.Location.Ids), mesh.Nodes, mesh.Elements, mesh.ObjectState)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cached_trace(cache_key):
+    if cache_key not in trace_cache:
+        return None
+    trace = ExtAPI.DataModel.GetObjectById(trace_cache[cache_key])
+    if (trace is None
+            or trace.DataModelObjectCategory != DataModelObjectCategory.ImportedTrace
+            or trace.Parent.Parent.ObjectId != Model.Materials.ObjectId):
+        del trace_cache[cache_key]
+        return None
+    return trace
+
+
+def import_trace(def_file, def_hash, use_dummy_net_data):
+    cache_key = (def_hash, mesh_fingerprint(), use_dummy_net_data)
+    trace = cached_trace(cache_key)
+    if trace is not None:
+        return trace, True
+
+    external_data_files = Ansys.Mechanical.ExternalData.ExternalDataFileCollection()
+    external_data_files.SaveFilesWithProject = True
+    external_data_file = Ansys.Mechanical.ExternalData.ExternalDataFile()
+    external_data_files.Add(external_data_file)  # Single File
+    external_data_file.Identifier = "edb"
+    external_data_file.Description = ""
+    external_data_file.IsMainFile = False
+    external_data_file.FilePath = def_file
+    external_data_file.ImportSettings = (
+        Ansys.Mechanical.ExternalData.ImportSettingsFactory.GetSettingsForFormat(
+            Ansys.Mechanical.DataModel.MechanicalEnums.ExternalData.ImportFormat.ECAD
+        )
+    )
+    import_settings = external_data_file.ImportSettings
+    import_settings.UseDummyNetData = use_dummy_net_data
+    imported_trace_group = Model.Materials.AddImportedTraceExternalData()
+    imported_trace_group.ImportExternalDataFiles(external_data_files)
 
-external_data_files = Ansys.Mechanical.ExternalData.ExternalDataFileCollection()
-external_data_files.SaveFilesWithProject = True
-external_data_file = Ansys.Mechanical.ExternalData.ExternalDataFile()
-external_data_files.Add(external_data_file)  # Single File
-external_data_file.Identifier = "edb"
-external_data_file.Description = ""
-external_data_file.IsMainFile = False
-external_data_file.FilePath = def_file
-external_data_file.ImportSettings = (
-    Ansys.Mechanical.ExternalData.ImportSettingsFactory.GetSettingsForFormat(
-        Ansys.Mechanical.DataModel.MechanicalEnums.ExternalData.ImportFormat.ECAD
+    allImpTraces = ExtAPI.DataModel.GetObjectsByType(
+        Ansys.Mechanical.DataModel.Enums.DataModelObjectCategory.ImportedTrace
     )
-)
-import_settings = external_data_file.ImportSettings
-import_settings.UseDummyNetData = False
-imported_trace_group = Model.Materials.AddImportedTraceExternalData()
-imported_trace_group.ImportExternalDataFiles(external_data_files)
 
-allImpTraces = ExtAPI.DataModel.GetObjectsByType(
-    Ansys.Mechanical.DataModel.Enums.DataModelObjectCategory.ImportedTrace
-)
+    imp_trace = [
+        x for x in allImpTraces if x.Parent.ObjectId == imported_trace_group.ObjectId
+    ][0]
+    imp_trace.Activate()
+    # imp_trace.InternalObject.GeometryDefineBy = 1
+
+    NSall = ExtAPI.DataModel.Project.Model.NamedSelections.GetChildren[
+        Ansys.ACT.Automation.Mechanical.NamedSelection
+    ](True)
+    ns_object = [i for i in NSall if i.Name == "board_layers"][0]
+    imp_trace.Location = ns_object
+    imp_trace.PropertyByName("PROPID_ExternalData").InternalValue = 1
 
-imp_trace = [
-    x for x in allImpTraces if x.Parent.ObjectId == imported_trace_group.ObjectId
-][0]
-imp_trace.Activate()
-# imp_trace.InternalObject.GeometryDefineBy = 1
 
-NSall = ExtAPI.DataModel.Project.Model.NamedSelections.GetChildren[
-    Ansys.ACT.Automation.Mechanical.NamedSelection
-](True)
-ns_object = [i for i in NSall if i.Name == "board_layers"][0]
-imp_trace.Location = ns_object
-imp_trace.PropertyByName("PROPID_ExternalData").InternalValue = 1
+    layers = imp_trace.Layers
+    num_layers = layers.Count
+    for layer in layers:
+        layer["Trace Material"] = "Copper Alloy"
+    vias = imp_trace.Vias
+    num_vias = vias.Count
+    for via in vias:
+        via["Plating Material"] = "Copper Alloy"
+    imp_trace.Import()
+    trace_cache[cache_key] = imp_trace.ObjectId
+    return imp_trace, False
 
 
-layers = imp_trace.Layers
-num_layers = layers.Count
-for layer in layers:
-    layer["Trace Material"] = "Copper Alloy"
-vias = imp_trace.Vias
-num_vias = vias.Count
-for via in vias:
-    via["Plating Material"] = "Copper Alloy"
-imp_trace.Import()
+imp_trace, trace_reused = import_trace(def_file, def_hash, False)
+print("imported trace reused from cache : " + str(trace_reused))
 
 
 # Exporting trace map snapshot to a png file
@@ -251,7 +421,31 @@ mechdir = ExtAPI.DataModel.AnalysisList[0].WorkingDir
 png_file_path = os.path.join(mechdir, image_name)
 Graphics.ExportImage(png_file_path, GraphicsImageExportFormat.PNG, set2d)
 
+"%d layers, %d vias" % (imp_trace.Layers.Count, imp_trace.Vias.Count)
+""")
+print(f"Imported trace: {output}")
+
+# %%
+# Reuse the mapped traces
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# A variant assigns FR-4 to the components instead of the copper alloy and
+# calls ``import_trace`` again with the same trace file, mesh, and import
+# settings. The cached traces are reused and the mapping step is skipped. The
+# components get their copper alloy back afterwards.
+
+output = mechanical.run_python_script("""
+def set_component_material(material):
+    with Transaction():
+        for body in Model.Geometry.GetChildren(DataModelObjectCategory.Body, True):
+            if body.Name.startswith("Component"):
+                body.Material = material
+
+set_component_material("FR-4")
+imp_trace, trace_reused = import_trace(def_file, def_hash, False)
+set_component_material("Copper Alloy")
+str(trace_reused)
 """)
+print(f"Mapped traces reused: {output}")
 
 # %%
 # Initialize the variable needed for the image directory
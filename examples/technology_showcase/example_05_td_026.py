@@ -39,12 +39,14 @@ This example demonstrates a nonlinear 3D analysis of a rubber boot seal to:
 # %%
 # Import necessary libraries
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~
+import base64
 import os
 
 from ansys.mechanical.core import launch_mechanical
 from ansys.mechanical.core.examples import download_file
 from matplotlib import image as mpimg
 from matplotlib import pyplot as plt
+import numpy as np
 
 # %%
 # Launch mechanical
@@ -105,6 +107,39 @@ mechanical.run_python_script(f"mat_part_file_path='{mat_part_file_path}'")
 result = mechanical.run_python_script("part_file_path")
 print(f"part_file_path on server: {result}")
 
+# %%
+# Define the remote displacement history
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define the time steps and the six remote displacement components as one
+# NumPy table, with one unit per column. Send the table to the server as a
+# packed binary payload in a single call. The server unpacks the columns and
+# assigns each one to its component in a single step. Use the same
+# ``pack_table`` function and server helper for load histories with many rows,
+# such as test rig measurements.
+
+
+def pack_table(table):
+    """Pack a 2D table as little-endian doubles encoded in base64."""
+    data = np.ascontiguousarray(table, dtype="<f8").tobytes()
+    return base64.b64encode(data).decode("ascii")
+
+
+rem_disp_units = ["s", "mm", "mm", "mm", "rad", "rad", "rad"]
+rem_disp_table = np.array(
+    [
+        # time, X, Y, Z, rotation X, rotation Y, rotation Z
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [2.0, 0.0, -10.0, 0.0, 0.0, 0.0, 0.0],
+        [3.0, 0.0, -10.0, 0.0, 0.0, 0.0, 0.55],
+    ]
+)
+
+mechanical.run_python_script(
+    f"rem_disp_table = '{pack_table(rem_disp_table)}'\n"
+    f"rem_disp_units = '{','.join(rem_disp_units)}'"
+)
+
 # %%
 # Run the script
 # ~~~~~~~~~~~~~~
@@ -112,8 +147,33 @@ print(f"part_file_path on server: {result}")
 # analysis.
 
 output = mechanical.run_python_script("""
+import base64
 import json
 import os
+import struct
+
+# Unpack a table of little-endian doubles sent as a base64 string and
+# return its columns.
+def unpack_table(payload, n_columns):
+    data = base64.b64decode(payload)
+    values = struct.unpack('<%dd' % (len(data) // 8), data)
+    return [values[column::n_columns] for column in range(n_columns)]
+
+# Set the tabular values of several load components. The first column of the
+# table holds the time steps, and each further column holds one component.
+# DiscreteValues only accepts a list of Quantity objects, so each column is
+# converted once from its unpacked floats, without parsing any unit strings,
+# and assigned in a single step. All assignments share one Transaction.
+def set_tabular_values(components, payload, units):
+    units = units.split(',')
+    columns = unpack_table(payload, len(units))
+    times = [Quantity(value, units[0]) for value in columns[0]]
+    outputs = [[Quantity(value, unit) for value in values]
+               for values, unit in zip(columns[1:], units[1:])]
+    with Transaction():
+        for component, output in zip(components, outputs):
+            component.Inputs[0].DiscreteValues = times
+            component.Output.DiscreteValues = output
 
 # Section 1: Read geometry and material information from the JSON file.
 geometry_import_group_11 = Model.GeometryImportGroup
@@ -256,62 +316,32 @@ ANA_SETTING.Stabilization = StabilizationType.Off
 
 #ANA_SETTING.NumberOfSteps = 3
 ANA_SETTING.NumberOfSteps = 2
-ANA_SETTING.CurrentStepNumber = 1
-ANA_SETTING.AutomaticTimeStepping = AutomaticTimeStepping.On
-ANA_SETTING.DefineBy = TimeStepDefineByType.Substeps
-ANA_SETTING.InitialSubsteps = 5
-ANA_SETTING.MinimumSubsteps = 5
-ANA_SETTING.MaximumSubsteps = 1000
-ANA_SETTING.StoreResultsAt = TimePointsOptions.EquallySpacedPoints
-ANA_SETTING.StoreResulsAtValue = 5
-
-ANA_SETTING.CurrentStepNumber = 2
-ANA_SETTING.AutomaticTimeStepping = AutomaticTimeStepping.On
-ANA_SETTING.DefineBy = TimeStepDefineByType.Substeps
-ANA_SETTING.InitialSubsteps = 10
-ANA_SETTING.MinimumSubsteps = 10
-ANA_SETTING.MaximumSubsteps = 1000
-ANA_SETTING.StoreResultsAt = TimePointsOptions.EquallySpacedPoints
-ANA_SETTING.StoreResulsAtValue = 10
-
-ANA_SETTING.CurrentStepNumber = 3
-ANA_SETTING.AutomaticTimeStepping = AutomaticTimeStepping.On
-ANA_SETTING.DefineBy = TimeStepDefineByType.Substeps
-ANA_SETTING.InitialSubsteps = 30
-ANA_SETTING.MinimumSubsteps = 30
-ANA_SETTING.MaximumSubsteps = 1000
-ANA_SETTING.StoreResultsAt = TimePointsOptions.EquallySpacedPoints
-ANA_SETTING.StoreResulsAtValue = 20
+# Substep settings of each step: initial, minimum, and maximum substeps, and
+# the number of equally spaced result points. Set them in one transaction so the
+# tree is validated and refreshed once for all steps.
+STEP_SETTINGS = [
+    (1, 5, 5, 1000, 5),
+    (2, 10, 10, 1000, 10),
+    (3, 30, 30, 1000, 20),
+]
+with Transaction():
+    for step, initial, minimum, maximum, store_at in STEP_SETTINGS:
+        ANA_SETTING.CurrentStepNumber = step
+        ANA_SETTING.AutomaticTimeStepping = AutomaticTimeStepping.On
+        ANA_SETTING.DefineBy = TimeStepDefineByType.Substeps
+        ANA_SETTING.InitialSubsteps = initial
+        ANA_SETTING.MinimumSubsteps = minimum
+        ANA_SETTING.MaximumSubsteps = maximum
+        ANA_SETTING.StoreResultsAt = TimePointsOptions.EquallySpacedPoints
+        ANA_SETTING.StoreResulsAtValue = store_at
 
 SOLN_INFO.NewtonRaphsonResiduals = 4
 
 REM_DISP = STAT_STRUC.AddRemoteDisplacement()
 REM_DISP.Location = RMPT01
-REM_DISP.XComponent.Inputs[0].DiscreteValues = [Quantity("0 [s]"), Quantity("1 [s]"),
-                                                Quantity("2 [s]"), Quantity("3 [s]")]
-REM_DISP.XComponent.Output.DiscreteValues = [Quantity("0 [mm]"), Quantity("0 [mm]"),
-                                             Quantity("0 [mm]"), Quantity("0 [mm]")]
-REM_DISP.YComponent.Inputs[0].DiscreteValues = [Quantity("0 [s]"), Quantity("1 [s]"),
-                                                Quantity("2 [s]"), Quantity("3 [s]")]
-REM_DISP.YComponent.Output.DiscreteValues = [Quantity("0 [mm]"), Quantity("0 [mm]"),
-                                             Quantity("-10 [mm]"), Quantity("-10 [mm]")]
-REM_DISP.ZComponent.Inputs[0].DiscreteValues = [Quantity("0 [s]"), Quantity("1 [s]"),
-                                                Quantity("2 [s]"), Quantity("3 [s]")]
-REM_DISP.ZComponent.Output.DiscreteValues = [Quantity("0 [mm]"), Quantity("0 [mm]"),
-                                             Quantity("0 [mm]"), Quantity("0 [mm]")]
-
-REM_DISP.RotationX.Inputs[0].DiscreteValues = [Quantity("0 [s]"), Quantity("1 [s]"),
-                                               Quantity("2 [s]"), Quantity("3 [s]")]
-REM_DISP.RotationX.Output.DiscreteValues = [Quantity("0 [rad]"), Quantity("0 [rad]"),
-                                            Quantity("0 [rad]"), Quantity("0 [rad]")]
-REM_DISP.RotationY.Inputs[0].DiscreteValues = [Quantity("0 [s]"), Quantity("1 [s]"),
-                                               Quantity("2 [s]"), Quantity("3 [s]")]
-REM_DISP.RotationY.Output.DiscreteValues = [Quantity("0 [rad]"), Quantity("0 [rad]"),
-                                            Quantity("0 [rad]"), Quantity("0 [rad]")]
-REM_DISP.RotationZ.Inputs[0].DiscreteValues = [Quantity("0 [s]"), Quantity("1 [s]"),
-                                               Quantity("2 [s]"), Quantity("3 [s]")]
-REM_DISP.RotationZ.Output.DiscreteValues = [Quantity("0 [rad]"), Quantity("0 [rad]"),
-                                            Quantity("0 [rad]"), Quantity("0.55 [rad]")]
+REM_DISP_COMPONENTS = [REM_DISP.XComponent, REM_DISP.YComponent, REM_DISP.ZComponent,
+                       REM_DISP.RotationX, REM_DISP.RotationY, REM_DISP.RotationZ]
+set_tabular_values(REM_DISP_COMPONENTS, rem_disp_table, rem_disp_units)
 
 FRIC_SUP01 = STAT_STRUC.AddFrictionlessSupport()
 FRIC_SUP01.Location = SYMM_FACES30
@@ -46,12 +46,14 @@ contact pressure prior to wear is evaluated.
 # %%
 # Import necessary libraries
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~
+import json
 import os
 
 from ansys.mechanical.core import launch_mechanical
 from ansys.mechanical.core.examples import download_file
 from matplotlib import image as mpimg
 from matplotlib import pyplot as plt
+import numpy as np
 
 # %%
 # Launch mechanical
@@ -353,6 +355,68 @@ json.dumps(my_results_details)
 """)
 print(output)
 
+# %%
+# Extract the normal stress history
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Instead of adding one result object per time point, define a function that
+# evaluates a single result object at every stored time point and reads the
+# value at each node of its scoping from the ``PlotData`` table. The stored
+# time points come from the result file, so every result set is read once. One
+# call returns the whole history as a ``(n_times, n_nodes)`` array.
+
+mechanical.run_python_script("""
+import json
+
+def stored_times(analysis):
+    reader = analysis.GetResultsData()
+    times = list(reader.ListTimeFreq)
+    reader.Dispose()
+    return times
+
+def to_float(value):
+    return float(value.Value) if hasattr(value, "Value") else float(value)
+
+def extract_time_history(result, times, unit):
+    nodes = None
+    values = []
+    for time in times:
+        result.DisplayTime = Quantity(time, unit)
+        result.EvaluateAllResults()
+        plot_data = result.PlotData
+        by_node = dict(zip(plot_data["Node"], plot_data["Values"]))
+        if nodes is None:
+            nodes = sorted(by_node)
+        values.append([to_float(by_node[node]) for node in nodes])
+    return json.dumps({"times": times, "nodes": [int(node) for node in nodes],
+                       "values": values})
+
+NORM_STRS_HISTORY = STAT_STRUC_SOLN.AddNormalStress()
+NORM_STRS_HISTORY.Location = NS_GRP.Children[6]
+NORM_STRS_HISTORY.NormalOrientation = NormalOrientationType.YAxis
+NORM_STRS_HISTORY.DisplayOption = ResultAveragingType.Averaged
+""")
+
+output = mechanical.run_python_script(
+    "extract_time_history(NORM_STRS_HISTORY, stored_times(STAT_STRUC), 's')"
+)
+history = json.loads(output)
+history_times = np.array(history["times"])
+normal_stress_history = np.array(history["values"])
+print(
+    f"Normal stress history shape: {normal_stress_history.shape} "
+    f"({len(history_times)} times, {len(history['nodes'])} nodes)"
+)
+
+plt.figure(figsize=(8, 5))
+plt.plot(history_times, normal_stress_history.min(axis=1), marker="o", label="minimum")
+plt.plot(history_times, normal_stress_history.mean(axis=1), marker="o", label="average")
+plt.plot(history_times, normal_stress_history.max(axis=1), marker="o", label="maximum")
+plt.xlabel("Time [s]")
+plt.ylabel("Normal stress (Y) [MPa]")
+plt.title("Normal stress history on the contact surface")
+plt.legend()
+plt.show()
+
 # %%
 # Initialize the variable needed for the image directory
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~